@@ -94,9 +94,10 @@ class SupervisorAgent:
     All implementation details are encapsulated within the agents themselves.
     """
     
-    def __init__(self, chat_interface=None):
+    def __init__(self, chat_interface=None, llm=None):
         self.chat_interface = chat_interface
-        self.llm = create_llm()
+        # Reuse the caller's LLM client when given, rather than building another
+        self.llm = llm if llm is not None else create_llm()
         self.current_plan: Optional[ExecutionPlan] = None
         self.pending_plan: Optional[ExecutionPlan] = None  # Plan waiting for user response
         self.pending_action: Optional[str] = None  # What we're waiting for (e.g., 'case_reference')
@@ -657,6 +658,6 @@ class SupervisorAgent:
         return str(result)[:100]
 
 
-def create_supervisor(chat_interface=None) -> SupervisorAgent:
+def create_supervisor(chat_interface=None, llm=None) -> SupervisorAgent:
     """Create a supervisor agent instance."""
-    return SupervisorAgent(chat_interface=chat_interface)
+    return SupervisorAgent(chat_interface=chat_interface, llm=llm)
@@ -11,6 +11,7 @@ This interface integrates with the new pipeline agents:
 import sys
 import re
 import json
+from collections import deque
 from pathlib import Path
 from typing import List, Optional
 from pipeline_crew import DocumentProcessingCrew, create_pipeline_crew
@@ -29,6 +30,18 @@ from rich.panel import Panel
 # Global console for rich output
 console = Console()
 
+# Quick command keywords (matched against the lowercased input)
+_HELP_COMMANDS = frozenset({'help', '/help', '?'})
+_RELOAD_COMMANDS = frozenset({'reload', '/reload', 'restart', '/restart'})
+_EXIT_COMMANDS = frozenset({'exit', 'quit', 'bye', '/exit'})
+_SHOW_CASES_COMMANDS = frozenset({'show cases', 'list cases', 'cases'})
+_SHOW_DOCS_COMMANDS = frozenset({'show docs', 'list docs', 'docs', 'show documents', 'list documents'})
+_STATUS_COMMANDS = frozenset({'status', 'show status'})
+_SUMMARIZE_COMMANDS = frozenset({'summarize case', 'summarize'})
+
+# Max messages replayed to the LLM each turn (the system prompt is kept separately)
+_HISTORY_LIMIT = 2 * max(1, config.get('chat.context_window_turns', 10))
+
 
 def print_markdown(text: str, title: str = None) -> None:
     """Render Markdown text beautifully in the terminal using rich."""
@@ -49,7 +62,8 @@ class ChatInterface:
         self.llm = None
         self.supervisor = None  # Supervisor agent for multi-step commands
         self.case_reference: Optional[str] = None
-        self.conversation_history = []
+        self.system_message: Optional[SystemMessage] = None
+        self.conversation_history = deque()
         
         self._initialize_system()
         
@@ -123,13 +137,13 @@ When users provide documents:
 
 Always prioritize efficiency and flexibility. Documents are first-class entities that can exist independently of cases."""
 
-            self.conversation_history.append(SystemMessage(content=system_prompt))
+            self.system_message = SystemMessage(content=system_prompt)
             
             # Setup tools
             self._setup_tools()
             
             # Initialize Supervisor Agent for multi-step command orchestration
-            self.supervisor = SupervisorAgent(chat_interface=self)
+            self.supervisor = SupervisorAgent(chat_interface=self, llm=self.llm)
             self.logger.info("✅ Supervisor agent initialized")
             
         except Exception as e:
@@ -192,9 +206,10 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
             # Add user message with context
             context = f"\nCurrent case: {self.case_reference or 'Not set'}"
             self.conversation_history.append(HumanMessage(content=user_message + context))
+            self._trim_history()
             
             # Get response from LLM with tools
-            response = self.llm_with_tools.invoke(self.conversation_history)
+            response = self.llm_with_tools.invoke(self._llm_messages())
             
             # Handle tool calls
             while response.tool_calls:
@@ -210,7 +225,7 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
                         )
                 
                 # Get next response
-                response = self.llm_with_tools.invoke(self.conversation_history)
+                response = self.llm_with_tools.invoke(self._llm_messages())
             
             # Final text response - extract text from content
             if isinstance(response.content, list):
@@ -235,6 +250,22 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
             self.logger.error(f"LLM error: {e}")
             return f"❌ Error: {str(e)}"
     
+    def _llm_messages(self) -> List:
+        """Build the LLM request: system prompt plus the retained history."""
+        if self.system_message is None:
+            return list(self.conversation_history)
+        return [self.system_message, *self.conversation_history]
+    
+    def _trim_history(self):
+        """Drop the oldest messages beyond _HISTORY_LIMIT, whole turns at a time.
+        
+        Trimming stops at a user message so tool results are never separated
+        from the tool calls that produced them.
+        """
+        history = self.conversation_history
+        while history and (len(history) > _HISTORY_LIMIT or not isinstance(history[0], HumanMessage)):
+            history.popleft()
+    
     def set_case_reference(self, case_ref: str) -> str:
         """Set active case reference and create metadata if new."""
         from datetime import datetime
@@ -492,32 +523,32 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
         """Handle quick commands (exit, help, reload, show cases, show docs, select case)."""
         cmd = user_input.strip().lower()
         
-        if cmd in ['help', '/help', '?']:
+        if cmd in _HELP_COMMANDS:
             return self.show_help()
         
-        if cmd in ['reload', '/reload', 'restart', '/restart']:
+        if cmd in _RELOAD_COMMANDS:
             return "reload"
         
-        if cmd in ['exit', 'quit', 'bye', '/exit']:
+        if cmd in _EXIT_COMMANDS:
             return "exit"
         
         # Quick commands for cases and documents
-        if cmd in ['show cases', 'list cases', 'cases']:
+        if cmd in _SHOW_CASES_COMMANDS:
             return self._show_cases()
         
-        if cmd in ['show docs', 'list docs', 'docs', 'show documents', 'list documents']:
+        if cmd in _SHOW_DOCS_COMMANDS:
             return self._show_documents()
         
-        if cmd in ['status', 'show status']:
+        if cmd in _STATUS_COMMANDS:
             return self._show_status()
         
         # Handle "select case <case_id>" or "use case <case_id>"
-        if cmd.startswith('select case ') or cmd.startswith('use case '):
+        if cmd.startswith(('select case ', 'use case ')):
             case_id = cmd.split(' ', 2)[-1].strip().upper()
             return self._select_case(case_id)
         
         # Handle "summarize case" or "summarize case <case_id>"
-        if cmd == 'summarize case' or cmd == 'summarize':
+        if cmd in _SUMMARIZE_COMMANDS:
             if self.case_reference:
                 return self._summarize_case(self.case_reference)
             else:
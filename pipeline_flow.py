@@ -17,6 +17,7 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 from pydantic import BaseModel, Field
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import json
 
 # CrewAI Flow imports
@@ -61,7 +62,7 @@ from tools.summary_tools import (
     export_results_json
 )
 
-from utilities import logger, settings
+from utilities import config, logger, settings
 
 
 # ==================== STATE MODEL ====================
@@ -412,6 +413,37 @@ def run_pipeline(input_path: str) -> Dict[str, Any]:
     }
 
 
+def _classify_and_extract(document_id: str) -> Dict[str, Any]:
+    """Classify then extract one document (touches only that document's files).
+    
+    Errors are returned as failed results rather than raised, so one bad
+    document cannot abort the batch and leave the rest of the drained queue
+    stuck in 'processing'.
+    """
+    doc_result = {"document_id": document_id}
+    
+    # Classify
+    try:
+        class_result = classify_document.run(document_id=document_id)
+    except Exception as e:
+        logger.error(f"Classification failed for {document_id}: {e}")
+        class_result = {"success": False, "error": str(e)}
+    doc_result["classification"] = class_result
+    
+    if class_result["success"]:
+        # Extract
+        try:
+            doc_result["extraction"] = extract_document_data.run(
+                document_id=document_id,
+                document_type=class_result.get("document_type", "unknown")
+            )
+        except Exception as e:
+            logger.error(f"Extraction failed for {document_id}: {e}")
+            doc_result["extraction"] = {"success": False, "error": str(e)}
+    
+    return doc_result
+
+
 def run_pipeline_sync(input_path: str, case_reference: str = None) -> Dict[str, Any]:
     """
     Run the pipeline synchronously without Flow (fallback).
@@ -470,46 +502,42 @@ def run_pipeline_sync(input_path: str, case_reference: str = None) -> Dict[str,
     all_document_ids = []  # Track ALL documents, not just successful ones
     
     # 4. Process each document
+    # Drain the queue first so queue-file updates stay on this thread
     while True:
         next_result = get_next_from_queue.run()
         
         if not next_result["has_next"]:
             break
         
-        document_id = next_result["document_id"]
-        all_document_ids.append(document_id)  # Track every document
-        doc_result = {"document_id": document_id}
-        
-        # Classify
-        class_result = classify_document.run(document_id=document_id)
-        doc_result["classification"] = class_result
-        
-        if class_result["success"]:
-            doc_type = class_result.get("document_type", "unknown")
-            doc_type_counts[doc_type] = doc_type_counts.get(doc_type, 0) + 1
-            
-            # Extract
-            extract_result = extract_document_data.run(
-                document_id=document_id,
-                document_type=doc_type
-            )
-            doc_result["extraction"] = extract_result
+        all_document_ids.append(next_result["document_id"])  # Track every document
+    
+    # Classification/extraction are API-bound and per-document, so run them
+    # concurrently; results come back in queue order
+    max_workers = max(1, min(config.get('processing.max_parallel_docs', 4), len(all_document_ids)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kyc_doc") as executor:
+        for doc_result in executor.map(_classify_and_extract, all_document_ids):
+            document_id = doc_result["document_id"]
+            class_result = doc_result["classification"]
             
-            if extract_result.get("success"):
-                completed_count += 1
-                results["processed_documents"].append(document_id)
+            if class_result["success"]:
+                doc_type = class_result.get("document_type", "unknown")
+                doc_type_counts[doc_type] = doc_type_counts.get(doc_type, 0) + 1
+                
+                if doc_result["extraction"].get("success"):
+                    completed_count += 1
+                    results["processed_documents"].append(document_id)
+                else:
+                    failed_count += 1
             else:
                 failed_count += 1
-        else:
-            failed_count += 1
-        
-        results["documents"].append(doc_result)
-        
-        # Mark processed
-        mark_document_processed.run(
-            document_id=document_id,
-            success=class_result["success"]
-        )
+            
+            results["documents"].append(doc_result)
+            
+            # Mark processed
+            mark_document_processed.run(
+                document_id=document_id,
+                success=class_result["success"]
+            )
     
     # 5. Generate summary
     summary_result = generate_processing_summary.run()
@@ -0,0 +1,31 @@
+"""
+Tests that case consistency checks are deterministic.
+
+Identical case data must give byte-identical results, whatever order the
+documents were read in, so prompts built from them stay cache-friendly.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from tools.case_tools import _check_address_consistency, _check_name_consistency
+
+
+@pytest.mark.parametrize("check, values", [
+    (_check_name_consistency, ["John Smith", "JOHN SMITH"]),
+    (_check_name_consistency, ["John Smith", "Jon Smith"]),
+    (_check_name_consistency, ["John Smith", "Jon Smith", "J. Smith", "Johnny Smith"]),
+    (_check_address_consistency, ["1 High St", "1 HIGH ST"]),
+    (_check_address_consistency, ["1 High St", "2 Low Rd", "3 Mid Ave"]),
+])
+def test_consistency_output_is_order_independent(check, values):
+    """Same values in a different order give byte-identical output."""
+    forward = json.dumps(check(values))
+    backward = json.dumps(check(list(reversed(values))))
+    
+    assert forward == backward
+    assert forward == json.dumps(check(values))
+    print(f"✅ TEST PASSED: {check.__name__} stable for {len(values)} values")
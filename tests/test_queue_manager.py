@@ -12,6 +12,7 @@ Tests cover:
 """
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from datetime import datetime
@@ -67,6 +68,36 @@ class TestQueueInitialization:
         assert data['queue'][0]['id'] == "QUEUE_00001"
         print("✅ TEST 2 PASSED: Existing queue loaded correctly")
 
+    def test_legacy_entries_get_sort_fields(self, tmp_path):
+        """Test legacy entries without priority/created_ts still sort."""
+        queue_file = tmp_path / "test_queue.json"
+
+        legacy_data = {
+            "queue": [
+                {
+                    "id": "QUEUE_00001",
+                    "status": "pending",
+                    "source_path": "/test/legacy.pdf",
+                    "created_at": "2026-01-01T10:00:00"
+                }
+            ],
+            "processed": []
+        }
+
+        with open(queue_file, 'w') as f:
+            json.dump(legacy_data, f)
+
+        queue = DocumentQueue(queue_file=queue_file)
+        test_file = tmp_path / "new.pdf"
+        test_file.write_text("new")
+        queue_id = queue.add_file(str(test_file), priority=1)
+
+        data = queue._load_queue()
+        assert data['queue'][0]['id'] == queue_id
+        assert data['queue'][1]['priority'] == 999
+        assert data['queue'][1]['created_ts'] > 0
+        print("✅ TEST 2b PASSED: Legacy entries migrated and sorted")
+
 
 class TestAddingDocuments:
     """Test adding documents from various sources."""
@@ -147,6 +178,10 @@ class TestAddingDocuments:
         # Verify all are marked as directory_scan
         for entry in data['queue']:
             assert entry['source_type'] == 'directory_scan'
+
+        # Batch shares one timestamp and keeps sorted file order
+        assert len({entry['created_at'] for entry in data['queue']}) == 1
+        assert [Path(e['source_path']).name for e in data['queue']] == ["doc1.pdf", "doc2.jpg", "doc3.png"]
         print("✅ TEST 5 PASSED: Directory scanned and valid files added")
     
     def test_add_nonexistent_file(self, tmp_path):
@@ -188,6 +223,51 @@ class TestQueueOperations:
         assert next_entry['id'] == queue_id2
         assert next_entry['priority'] == 1
         print("✅ TEST 7 PASSED: Get next returns highest priority pending")
+
+    def test_get_next_sees_external_updates(self, tmp_path):
+        """Test get_next reflects changes written by another queue instance."""
+        queue_file = tmp_path / "test_queue.json"
+        queue = DocumentQueue(queue_file=queue_file)
+
+        test_file1 = tmp_path / "test1.pdf"
+        test_file1.write_text("test 1")
+        test_file2 = tmp_path / "test2.pdf"
+        test_file2.write_text("test 2")
+        queue_id1 = queue.add_file(str(test_file1))
+        queue_id2 = queue.add_file(str(test_file2))
+
+        assert queue.get_next()['id'] == queue_id1
+
+        # Another process marks the head entry as processing
+        DocumentQueue(queue_file=queue_file).mark_processing(queue_id1)
+
+        assert queue.get_next()['id'] == queue_id2
+        print("✅ TEST 7b PASSED: Get next picks up external queue changes")
+
+    def test_get_next_sees_same_size_external_updates(self, tmp_path):
+        """Test get_next notices a change that keeps the file's size and mtime."""
+        queue_file = tmp_path / "test_queue.json"
+        queue = DocumentQueue(queue_file=queue_file)
+
+        test_file1 = tmp_path / "test1.pdf"
+        test_file1.write_text("test 1")
+        test_file2 = tmp_path / "test2.pdf"
+        test_file2.write_text("test 2")
+        queue_id1 = queue.add_file(str(test_file1))
+        queue_id2 = queue.add_file(str(test_file2))
+
+        assert queue.get_next()['id'] == queue_id1
+
+        # Another process skips the head entry within the same mtime tick
+        stat = queue_file.stat()
+        data = json.loads(queue_file.read_text())
+        data['queue'][0]['status'] = 'skipped'
+        queue_file.write_text(json.dumps(data, indent=2))
+        os.utime(queue_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert queue_file.stat().st_size == stat.st_size
+
+        assert queue.get_next()['id'] == queue_id2
+        print("✅ TEST 7c PASSED: Get next picks up same-size external changes")
     
     def test_get_queue_status(self, tmp_path):
         """Test queue status summary."""
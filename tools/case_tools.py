@@ -102,10 +102,11 @@ def _check_name_consistency(names: List[str]) -> Dict[str, Any]:
     if not names:
         return {"status": "no_data", "message": "No names extracted"}
     
-    unique_names = list(set(n.lower().strip() for n in names if n))
+    # Sorted so the result (and any prompt it ends up in) is stable across runs
+    unique_names = sorted(set(n.lower().strip() for n in names if n))
     
     if len(unique_names) == 1:
-        return {"status": "consistent", "name": names[0]}
+        return {"status": "consistent", "name": min(n for n in names if n)}
     elif len(unique_names) <= 2:
         return {"status": "minor_variance", "names": unique_names, "message": "Minor spelling differences"}
     else:
@@ -117,10 +118,10 @@ def _check_address_consistency(addresses: List[str]) -> Dict[str, Any]:
     if not addresses:
         return {"status": "no_data", "message": "No addresses extracted"}
     
-    unique_addresses = list(set(a.lower().strip() for a in addresses if a))
+    unique_addresses = sorted(set(a.lower().strip() for a in addresses if a))
     
     if len(unique_addresses) == 1:
-        return {"status": "consistent", "address": addresses[0]}
+        return {"status": "consistent", "address": min(a for a in addresses if a)}
     else:
         return {"status": "variance", "addresses": unique_addresses, "message": "Multiple addresses found"}
 
@@ -11,9 +11,7 @@ These tools handle:
 All operations are deterministic - no LLM reasoning for file operations.
 """
 
-import os
 import json
-import hashlib
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
@@ -21,13 +19,28 @@ from crewai.tools import tool
 
 # Import utilities
 try:
-    from utilities import logger, settings
+    from utilities import logger, settings, generate_document_id, compute_file_hash
 except ImportError:
     import logging
     logger = logging.getLogger(__name__)
+    import hashlib
+    import uuid
     class Settings:
         documents_dir = "./documents"
     settings = Settings()
+    
+    def generate_document_id() -> str:
+        """Generate unique document ID with timestamp and random suffix."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"DOC_{timestamp}_{uuid.uuid4().hex[:5].upper()}"
+    
+    def compute_file_hash(file_path: str) -> str:
+        """Compute SHA256 hash of file for deduplication."""
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(8192), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
 
 # PDF conversion support
 try:
@@ -37,24 +50,11 @@ except ImportError:
     PDF2IMAGE_AVAILABLE = False
     logger.warning("pdf2image not available. PDF conversion disabled.")
 
-
-# ==================== HELPER FUNCTIONS ====================
-
-def generate_document_id() -> str:
-    """Generate unique document ID with timestamp and random suffix."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    random_suffix = hashlib.md5(os.urandom(8)).hexdigest()[:5].upper()
-    return f"DOC_{timestamp}_{random_suffix}"
+# File types picked up by scanning and intake (shared with the web upload filter)
+SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp'})
 
 
-def compute_file_hash(file_path: str) -> str:
-    """Compute SHA256 hash of file for deduplication."""
-    sha256 = hashlib.sha256()
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
+# ==================== HELPER FUNCTIONS ====================
 
 def get_metadata_schema() -> Dict[str, Any]:
     """
@@ -218,10 +218,9 @@ def scan_input_path(input_path: str) -> Dict[str, Any]:
     
     if path.is_dir():
         # Count supported files recursively
-        supported_extensions = {'.pdf', '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp'}
         files = [
             f for f in path.rglob("*")
-            if f.is_file() and f.suffix.lower() in supported_extensions
+            if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS
         ]
         return {
             "path_type": "folder",
@@ -266,8 +265,6 @@ def expand_folder(folder_path: str, recursive: bool = True) -> Dict[str, Any]:
             "message": f"Invalid folder path: {path}"
         }
     
-    supported_extensions = {'.pdf', '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp'}
-    
     if recursive:
         all_files = list(path.rglob("*"))
     else:
@@ -275,7 +272,7 @@ def expand_folder(folder_path: str, recursive: bool = True) -> Dict[str, Any]:
     
     files = [
         str(f) for f in all_files
-        if f.is_file() and f.suffix.lower() in supported_extensions
+        if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS
     ]
     
     # Group by extension
@@ -12,6 +12,7 @@ from .utils import (
     validate_file_extension,
     validate_file_size,
     compute_file_hash,
+    calculate_file_hash,
     create_document_metadata,
     ensure_directory,
     generate_document_id,
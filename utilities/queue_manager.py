@@ -13,8 +13,18 @@ All documents flow through the same queue for consistent processing.
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from operator import itemgetter
+import copy
+import hashlib
+import heapq
 import json
 
+# Fast JSON decoding when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import utilities
 try:
     from utilities import logger, settings
@@ -28,6 +38,10 @@ except ImportError:
     settings = Settings()
 
 
+# Queue ordering: priority (lower first), then creation time
+_SORT_KEY = itemgetter('priority', 'created_ts')
+
+
 class DocumentQueue:
     """Unified queue for all document processing."""
     
@@ -43,6 +57,15 @@ class DocumentQueue:
         else:
             self.queue_file = Path(settings.documents_dir) / "processing_queue.json"
         
+        # Heap of (priority, created_ts, id) for pending entries, rebuilt
+        # whenever the queue file changes on disk
+        self._pending: List[tuple] = []
+        self._pending_entries: Dict[str, Dict[str, Any]] = {}
+        self._pending_sig: Optional[tuple] = None
+        
+        # Read buffer reused across loads; grows to fit the queue file
+        self._read_buf = bytearray()
+        
         self._ensure_queue_file()
     
     def _ensure_queue_file(self):
@@ -66,8 +89,21 @@ class DocumentQueue:
             Queue data with 'queue' and 'processed' lists
         """
         try:
-            with open(self.queue_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            return self._parse_queue(self._read_queue_bytes())
+        except Exception as e:
+            logger.error(f"Failed to load queue: {e}")
+            return {"queue": [], "processed": []}
+    
+    def _parse_queue(self, size: int) -> Dict[str, Any]:
+        """
+        Parse queue data from the first size bytes of the read buffer.
+        
+        Returns:
+            Queue data with 'queue' and 'processed' lists
+        """
+        try:
+            with memoryview(self._read_buf)[:size] as view:
+                data = orjson.loads(view) if orjson else json.loads(bytes(view))
             
             # Ensure required keys exist
             if 'queue' not in data:
@@ -75,6 +111,13 @@ class DocumentQueue:
             if 'processed' not in data:
                 data['processed'] = []
             
+            # Fill sort fields on legacy entries so _SORT_KEY can index directly
+            for entry in data['queue']:
+                if 'priority' not in entry:
+                    entry['priority'] = 999
+                if 'created_ts' not in entry:
+                    entry['created_ts'] = self._parse_timestamp(entry.get('created_at', ''))
+            
             return data
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse queue file: {e}")
@@ -83,6 +126,27 @@ class DocumentQueue:
             logger.error(f"Failed to load queue: {e}")
             return {"queue": [], "processed": []}
     
+    def _read_queue_bytes(self) -> int:
+        """
+        Read the queue file into the reusable read buffer.
+        
+        Returns:
+            Number of bytes read into self._read_buf
+        """
+        file_size = self.queue_file.stat().st_size
+        if file_size >= len(self._read_buf):
+            self._read_buf = bytearray(max(file_size + 1, 2 * len(self._read_buf)))
+        
+        with open(self.queue_file, 'rb') as f:
+            size = f.readinto(self._read_buf)
+            if size == len(self._read_buf):
+                # File grew since stat() - append the remainder
+                remainder = f.read()
+                self._read_buf.extend(remainder)
+                size += len(remainder)
+        
+        return size
+    
     def _save_queue(self, data: Dict[str, Any]):
         """
         Save queue to disk.
@@ -91,11 +155,46 @@ class DocumentQueue:
             data: Queue data to save
         """
         try:
+            content = json.dumps(data, indent=2)
             with open(self.queue_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+                f.write(content)
         except Exception as e:
             logger.error(f"Failed to save queue: {e}")
             raise
+        
+        self._sync_pending(data, self._content_signature(content.encode('utf-8')))
+    
+    @staticmethod
+    def _content_signature(content) -> bytes:
+        """
+        Get a change signature for queue file content.
+        
+        A digest rather than (mtime, size): a status change written by another
+        process within one mtime tick can leave both unchanged.
+        
+        Returns:
+            16-byte BLAKE2b digest of the content
+        """
+        return hashlib.blake2b(content, digest_size=16).digest()
+    
+    def _sync_pending(self, data: Dict[str, Any], signature: Optional[bytes]):
+        """
+        Rebuild the in-memory pending heap from queue data.
+        
+        Args:
+            data: Queue data matching the file at signature
+            signature: File signature the data was read from/written to
+        """
+        self._pending_entries = {
+            entry['id']: entry for entry in data['queue']
+            if entry.get('status') == 'pending'
+        }
+        self._pending = [
+            (entry.get('priority', 999), entry.get('created_ts', 0.0), queue_id)
+            for queue_id, entry in self._pending_entries.items()
+        ]
+        heapq.heapify(self._pending)
+        self._pending_sig = signature
     
     def add_directory(self, directory_path: str, priority: int = 1) -> List[str]:
         """
@@ -129,16 +228,12 @@ class DocumentQueue:
         
         logger.info(f"Found {len(files)} valid documents in {directory_path}")
         
-        # Add each file to queue
-        queue_ids = []
-        for file_path in sorted(files):  # Sort for consistent ordering
-            queue_id = self.add_file(
-                file_path=str(file_path),
-                source_type="directory_scan",
-                priority=priority
-            )
-            if queue_id:
-                queue_ids.append(queue_id)
+        # Add all files in a single queue update (sorted for consistent ordering)
+        queue_ids = self._add_files_bulk(
+            [{"file_path": str(file_path)} for file_path in sorted(files)],
+            source_type="directory_scan",
+            priority=priority
+        )
         
         logger.info(f"Added {len(queue_ids)} documents to queue from directory")
         return queue_ids
@@ -159,47 +254,86 @@ class DocumentQueue:
         Returns:
             Queue ID if successful, None otherwise
         """
-        # Validate file exists
-        if not Path(file_path).exists():
-            logger.error(f"File not found: {file_path}")
-            return None
+        queue_ids = self._add_files_bulk(
+            [{"file_path": file_path, "parent_id": parent_id, "metadata": metadata}],
+            source_type=source_type,
+            priority=priority
+        )
+        return queue_ids[0] if queue_ids else None
+    
+    def _add_files_bulk(self, files: List[Dict[str, Any]], source_type: str = "manual",
+                        priority: int = 1) -> List[str]:
+        """
+        Add several files to queue with a single load/save cycle.
         
-        data = self._load_queue()
+        All entries in the batch share one creation timestamp.
+        
+        Args:
+            files: List of dicts with 'file_path' and optional 'parent_id'/'metadata'
+            source_type: Source of files (manual, directory_scan, child_creation)
+            priority: Queue priority (lower = higher priority)
+        
+        Returns:
+            List of queue IDs for added files
+        """
+        # Validate files exist
+        valid_files = []
+        for item in files:
+            if Path(item['file_path']).exists():
+                valid_files.append(item)
+            else:
+                logger.error(f"File not found: {item['file_path']}")
         
-        # Generate unique queue ID
+        if not valid_files:
+            return []
+        
+        data = self._load_queue()
         existing_ids = [item['id'] for item in data['queue']]
-        queue_id = self._generate_queue_id(existing_ids)
-        
-        # Create queue entry
-        entry = {
-            "id": queue_id,
-            "document_id": None,  # Will be set after intake
-            "source_type": source_type,
-            "source_path": file_path,
-            "status": "pending",
-            "created_at": datetime.now().isoformat(),
-            "priority": priority,
-            "metadata": metadata or {}
-        }
+        tail_key = _SORT_KEY(data['queue'][-1]) if data['queue'] else None
         
-        # Add parent_id if provided
-        if parent_id:
-            entry["parent_id"] = parent_id
+        # Snapshot the timestamp once for the whole batch
+        now = datetime.now()
+        created_at = now.isoformat()
+        created_ts = now.timestamp()
         
-        # Add to queue
-        data['queue'].append(entry)
+        queue_ids = []
+        for item in valid_files:
+            # Generate unique queue ID
+            queue_id = self._generate_queue_id(existing_ids)
+            existing_ids.append(queue_id)
+            
+            # Create queue entry
+            entry = {
+                "id": queue_id,
+                "document_id": None,  # Will be set after intake
+                "source_type": source_type,
+                "source_path": item['file_path'],
+                "status": "pending",
+                "created_at": created_at,
+                "created_ts": created_ts,
+                "priority": priority,
+                "metadata": item.get('metadata') or {}
+            }
+            
+            # Add parent_id if provided
+            if item.get('parent_id'):
+                entry["parent_id"] = item['parent_id']
+            
+            data['queue'].append(entry)
+            queue_ids.append(queue_id)
+            
+            file_name = Path(item['file_path']).name
+            logger.info(f"Added to queue: {queue_id} - {file_name} (priority={priority}, source={source_type})")
         
-        # Sort by priority (lower first), then creation time
-        # Use .get() to handle legacy entries without priority
-        data['queue'].sort(key=lambda x: (x.get('priority', 999), x.get('created_at', '')))
+        # Sort by priority (lower first), then creation time - unless the
+        # batch already belongs at the tail (the common same-priority case)
+        if tail_key is not None and tail_key > (priority, created_ts):
+            data['queue'].sort(key=_SORT_KEY)
         
         # Save queue
         self._save_queue(data)
         
-        file_name = Path(file_path).name
-        logger.info(f"Added to queue: {queue_id} - {file_name} (priority={priority}, source={source_type})")
-        
-        return queue_id
+        return queue_ids
     
     def add_child_documents(self, child_ids: List[str], parent_id: str, 
                            priority: int = 2) -> List[str]:
@@ -215,7 +349,7 @@ class DocumentQueue:
             List of queue IDs for added children
         """
         intake_dir = Path(settings.documents_dir) / "intake"
-        queue_ids = []
+        children = []
         
         for idx, child_id in enumerate(child_ids, 1):
             # Find child document file (not metadata.json)
@@ -236,21 +370,18 @@ class DocumentQueue:
                 except Exception as e:
                     logger.warning(f"Failed to load child metadata: {e}")
             
-            # Add child to queue
-            queue_id = self.add_file(
-                file_path=str(child_files[0]),
-                source_type="child_creation",
-                priority=priority,
-                parent_id=parent_id,
-                metadata={
+            children.append({
+                "file_path": str(child_files[0]),
+                "parent_id": parent_id,
+                "metadata": {
                     "page_number": child_metadata.get("page_number", idx),
                     "generated_from_pdf": True,
                     "child_document_id": child_id
                 }
-            )
-            
-            if queue_id:
-                queue_ids.append(queue_id)
+            })
+        
+        # Add all children to queue in one update
+        queue_ids = self._add_files_bulk(children, source_type="child_creation", priority=priority)
         
         logger.info(f"Added {len(queue_ids)} child documents to queue for parent {parent_id}")
         return queue_ids
@@ -262,14 +393,24 @@ class DocumentQueue:
         Returns:
             Next queue entry dict, or None if queue is empty
         """
-        data = self._load_queue()
+        # Only re-parse the file if its content changed since the heap was built
+        try:
+            size = self._read_queue_bytes()
+        except OSError as e:
+            logger.error(f"Failed to load queue: {e}")
+            self._sync_pending({"queue": [], "processed": []}, None)
+            return None
         
-        # Find first pending entry (queue is already sorted by priority)
-        for entry in data['queue']:
-            if entry['status'] == 'pending':
-                return entry
+        with memoryview(self._read_buf)[:size] as view:
+            signature = self._content_signature(view)
+        if self._pending_sig is None or signature != self._pending_sig:
+            self._sync_pending(self._parse_queue(size), signature)
+        
+        if not self._pending:
+            return None
         
-        return None
+        # Return a copy so callers can't mutate the cached entry
+        return copy.deepcopy(self._pending_entries[self._pending[0][2]])
     
     def mark_processing(self, queue_id: str):
         """
@@ -1,10 +1,15 @@
 """Utility functions for the KYC-AML Agentic AI Orchestrator."""
 import os
+import json
 from pathlib import Path
 from typing import Optional, Dict, Any
 import hashlib
 from datetime import datetime
 import uuid
+from functools import lru_cache
+
+# Read size used when streaming files through a hash
+_HASH_CHUNK_SIZE = 1024 * 1024
 
 
 def generate_document_id() -> str:
@@ -34,12 +39,19 @@ def validate_file_size(file_path: str, max_size_bytes: int) -> bool:
 def compute_file_hash(file_path: str) -> str:
     """Compute SHA256 hash of a file."""
     sha256_hash = hashlib.sha256()
+    # Reuse one buffer for every chunk instead of allocating a bytes object per read
+    buffer = bytearray(_HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+        while (size := f.readinto(buffer)):
+            sha256_hash.update(view[:size])
     return sha256_hash.hexdigest()
 
 
+# Backward compatible alias
+calculate_file_hash = compute_file_hash
+
+
 def create_document_metadata(file_path: str) -> Dict[str, Any]:
     """Create metadata for a document."""
     file_path_obj = Path(file_path)
@@ -60,7 +72,6 @@ def ensure_directory(directory: str) -> None:
 
 def load_ui_messages() -> Dict[str, Any]:
     """Load UI messages from config/ui_messages.json for consistent messaging across interfaces."""
-    import json
     config_path = Path(__file__).parent.parent / "config" / "ui_messages.json"
     
     if config_path.exists():
@@ -97,6 +108,18 @@ def get_banner_text(format: str = "cli") -> Dict[str, str]:
     }
 
 
+@lru_cache(maxsize=8)
+def _cli_banner(app_name: str) -> str:
+    """Build the box-drawn CLI header for an app name (cached per process)."""
+    # Remove emoji for box centering (emoji width causes alignment issues)
+    app_name_clean = app_name.replace('🤖 ', '')
+    return "\n".join([
+        "╔══════════════════════════════════════════════════════════════╗",
+        f"║       🤖 {app_name_clean:^44}       ║",
+        "╚══════════════════════════════════════════════════════════════╝",
+    ])
+
+
 def get_capabilities_text(format: str = "cli") -> str:
     """Get formatted capabilities text for help display.
     
@@ -137,13 +160,9 @@ def get_capabilities_text(format: str = "cli") -> str:
     else:
         # CLI format with box drawing
         app_name = ui.get('app', {}).get('name', 'KYC-AML Agentic AI Orchestrator')
-        # Remove emoji for box centering (emoji width causes alignment issues)
-        app_name_clean = app_name.replace('🤖 ', '')
         
         lines = [
-            "╔══════════════════════════════════════════════════════════════╗",
-            f"║       🤖 {app_name_clean:^44}       ║",
-            "╚══════════════════════════════════════════════════════════════╝",
+            _cli_banner(app_name),
             "",
             f"💡 {ui.get('capabilities', {}).get('headline', 'What I Can Do')}:",
         ]
@@ -12,15 +12,24 @@ Features:
 """
 import streamlit as st
 from pathlib import Path
+import hashlib
 import json
 import os
+import re
 import shutil
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
 import warnings
 import logging
 import threading
 import signal as _signal_module
+import sqlite3
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
 # Suppress CrewAI signal handler warnings BEFORE importing CrewAI
 # These warnings occur because CrewAI telemetry tries to register signal handlers
@@ -38,13 +47,15 @@ _signal_module.signal = _safe_signal
 # Also suppress any remaining log messages from crewai telemetry
 logging.getLogger('crewai.telemetry.telemetry').setLevel(logging.CRITICAL)
 
-# Core imports
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
+# Fast JSON for metadata files when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Core imports - LangChain, CrewAI pipeline and agents are imported at first
+# use so the page can render before those heavy modules load
 from utilities import config, settings, logger
-from utilities.llm_factory import create_llm, get_model_info
-from tools.chat_tools import create_chat_tools
-from pipeline_flow import run_pipeline_sync
-from agents.supervisor_agent import SupervisorAgent
 
 
 # Page configuration
@@ -55,8 +66,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling (re-sent on every full run, so only rules in use)
+_CSS_BLOCK = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -67,41 +78,6 @@ st.markdown("""
         text-align: center;
         padding: 1rem;
     }
-    .status-badge {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        border-radius: 1rem;
-        font-size: 0.875rem;
-        font-weight: 500;
-    }
-    .status-active {
-        background-color: #d4edda;
-        color: #155724;
-    }
-    .status-pending {
-        background-color: #fff3cd;
-        color: #856404;
-    }
-    .case-card {
-        background-color: #f8f9fa;
-        border-left: 4px solid #1f77b4;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 0 0.5rem 0.5rem 0;
-    }
-    .doc-card {
-        background-color: #ffffff;
-        border: 1px solid #dee2e6;
-        padding: 0.75rem;
-        margin: 0.25rem 0;
-        border-radius: 0.5rem;
-    }
-    .metric-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        text-align: center;
-    }
     code {
         background-color: #f1f3f4;
         padding: 0.2rem 0.4rem;
@@ -109,7 +85,673 @@ st.markdown("""
         font-family: 'SF Mono', 'Monaco', monospace;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_CSS_BLOCK, unsafe_allow_html=True)
+
+
+# Quick commands handled without the LLM: exact match → handler method name
+_EXACT_COMMANDS = {
+    'exit': '_exit_hint', 'quit': '_exit_hint', 'bye': '_exit_hint', '/exit': '_exit_hint',
+    'show cases': '_show_cases', 'list cases': '_show_cases', 'cases': '_show_cases',
+    'show docs': '_show_documents', 'list docs': '_show_documents', 'docs': '_show_documents',
+    'show documents': '_show_documents', 'list documents': '_show_documents',
+    'status': '_show_status', 'show status': '_show_status',
+    'summarize case': '_summarize_current_case', 'summarize': '_summarize_current_case',
+    'help': '_show_help', '?': '_show_help', '/help': '_show_help',
+}
+
+# Quick commands taking a case ID argument: prefix → handler method name
+_PREFIX_COMMANDS = {
+    'select case': 'set_case_reference',
+    'use case': 'set_case_reference',
+    'summarize case': '_summarize_case',
+}
+_PREFIX_COMMAND_RE = re.compile(r'^(select case|use case|summarize case) (.+)$')
+
+# Multi-step command detection: action verbs and chaining words (whole words only)
+_ACTION_RE = re.compile(
+    r'\b(create|switch|process|classify|extract|summarize|summary|list|status|add|upload)\b'
+)
+_CHAIN_RE = re.compile(r'\b(and|then|after|finally)\b')
+
+
+# Max messages kept in the LLM conversation history before it is compacted
+# (chat.context_window_turns user/assistant turns)
+_HISTORY_WINDOW = 2 * max(1, config.get('chat.context_window_turns', 10))
+
+# Estimated tokens of history that also trigger compaction
+_HISTORY_TOKEN_BUDGET = config.get('chat.history_token_budget', 8000)
+
+# Instructions for condensing compacted history into the system prompt
+_SUMMARY_PROMPT = (
+    "Summarize the conversation below for your own later reference. Keep decisions, "
+    "case references, document IDs and open questions. Be concise."
+)
+
+# Number of chat messages rendered at once; older ones load on demand
+_MESSAGE_WINDOW = 50
+
+# System prompt for the LLM - matching CLI capabilities
+_SYSTEM_PROMPT = """You are an intelligent KYC-AML Document Processing Assistant powered by CrewAI pipeline agents.
+
+Your Role:
+- Assist with document processing, classification, and data extraction
+- Support both case-based workflows (KYC/AML compliance) and general document processing
+- Help manage customer onboarding cases when needed
+- Process standalone documents without requiring case references
+- Resume processing for documents that have pending stages
+
+Your Pipeline Agents:
+You have 5 specialized agents working together:
+1. **QueueAgent**: Scans input paths, expands folders, splits PDFs into pages, builds the processing queue
+2. **ClassificationAgent**: Classifies documents via REST API (passport, license, utility bill, PAN, Aadhaar, etc.)
+3. **ExtractionAgent**: Extracts structured data from documents via REST API
+4. **MetadataAgent**: Tracks status, handles errors, manages retries
+5. **SummaryAgent**: Generates processing reports and statistics
+
+Your Capabilities:
+You have access to specialized tools to:
+1. Process documents WITHOUT requiring a case reference - documents get globally unique IDs
+2. Link processed documents to cases when needed (many-to-many relationships supported)
+3. List and switch between customer cases (e.g., KYC_2026_001)
+4. Check case status with detailed metadata (workflow stage, document types, extracted data)
+5. Browse all documents in the system, filtered by stage or case
+6. Retrieve specific documents by their unique ID
+7. **Run the full pipeline** on files or folders
+8. **Resume processing** for existing documents by their document ID
+9. **Find documents by ID** across all cases
+
+Document Processing Workflows:
+A. CASE-AGNOSTIC: User provides document → Process immediately → Get unique document ID → Optionally link to case later
+B. CASE-BASED: User provides case + document → Process and auto-link to case
+C. **PIPELINE RUN**: User provides folder path → Queue all files → Classify → Extract → Generate summary
+D. **RESUME PROCESSING**: User provides document ID (DOC_...) → Load metadata → Resume from pending stage
+
+IMPORTANT: 
+- When a user provides a document path without mentioning a case, process it immediately WITHOUT asking for a case reference
+- When a user provides a document ID (starts with "DOC_"), use find_document_by_id or process_document_by_id
+- When a user provides a folder, use run_document_pipeline to process all documents
+- Documents can always be linked to cases later if needed
+- Never block document processing by requiring a case upfront
+
+Communication Style:
+- Professional yet friendly - be helpful and efficient
+- Clear and concise - users value quick results
+- Proactive - suggest linking to cases AFTER processing, not before
+- Transparent - explain what the pipeline agents are doing
+- Use Markdown formatting for readability
+
+Always prioritize efficiency and flexibility. Documents are first-class entities that can exist independently of cases."""
+
+
+# Tool-call rounds sent to the LLM in full; older rounds are condensed
+_MAX_TOOL_EXCHANGES = 3
+
+# Characters of each tool result kept when a round is condensed
+_CONDENSED_RESULT_CHARS = 200
+
+
+@lru_cache(maxsize=32)
+def _system_message(history_summary: str = ""):
+    """Build the system prompt message (plus any history summary) once per summary."""
+    from langchain_core.messages import SystemMessage
+    if not history_summary:
+        return SystemMessage(content=_SYSTEM_PROMPT)
+    return SystemMessage(
+        content=f"{_SYSTEM_PROMPT}\n\nSummary of the earlier conversation:\n{history_summary}"
+    )
+
+
+# Max threads used to read metadata files in parallel
+_SCAN_WORKERS = 16
+
+# Chunk size used when streaming uploads to disk
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Max threads used to write uploaded files to disk in parallel
+_UPLOAD_WORKERS = 8
+
+@lru_cache(maxsize=1)
+def _upload_types() -> Tuple[str, ...]:
+    """Upload types the pipeline's intake picks up (tools.queue_tools.SUPPORTED_EXTENSIONS)."""
+    from tools.queue_tools import SUPPORTED_EXTENSIONS
+    return tuple(sorted(ext.lstrip('.') for ext in SUPPORTED_EXTENSIONS))
+
+
+def _upload_rejection(uploaded_file) -> Optional[str]:
+    """Return why an upload would be dropped by the pipeline, or None if it is accepted."""
+    if uploaded_file.size > settings.max_document_size_bytes:
+        return f"over {settings.max_document_size_mb} MB"
+    if Path(uploaded_file.name).suffix.lower().lstrip('.') not in _upload_types():
+        return "unsupported file type"
+    return None
+
+
+def _save_upload(directory: Path, index: int, uploaded_file) -> Path:
+    """Stream one uploaded file into its own subdirectory and return its path.
+    
+    Each upload gets a subdirectory named by its index, so files with the same
+    name keep their name without two writers sharing a path. The pipeline's
+    folder scan is recursive, so it still picks them all up.
+    """
+    file_path = directory / str(index) / uploaded_file.name
+    file_path.parent.mkdir()
+    uploaded_file.seek(0)
+    with open(file_path, "wb") as f:
+        shutil.copyfileobj(uploaded_file, f, length=_UPLOAD_CHUNK_SIZE)
+    return file_path
+
+
+@st.cache_resource(show_spinner=False)
+def _get_token_encoder():
+    """Load the BPE tokenizer once per process (None if tiktoken is unavailable)."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def _estimate_tokens(message) -> int:
+    """Approximate token count for a message (~4 characters per token without tiktoken)."""
+    text = _extract_text(message.content)
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return len(text) // 4
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def _extract_text(content: Any) -> str:
+    """Extract the text from LLM message content (a string or a list of blocks)."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return '\n'.join(
+            block if isinstance(block, str) else block.get('text', '')
+            for block in content
+            if isinstance(block, str)
+            or (isinstance(block, dict) and block.get('type') == 'text')
+        )
+    return str(content)
+
+
+# Seconds between UI updates while streaming LLM output
+_STREAM_FLUSH_INTERVAL = 0.05
+
+# Seconds within which an identical submission is treated as a double-send
+_DUPLICATE_SUBMIT_WINDOW = 2.0
+
+
+_PROMPT_SPACE_RE = re.compile(r'\s+')
+
+
+def _normalize_prompt(text: str) -> str:
+    """Normalize a user prompt for cache lookups (whitespace only).
+    
+    Case and punctuation are kept, since paths, case IDs and document IDs are
+    case-sensitive. Lines are normalized separately so the appended case
+    context line stays distinct from the question itself.
+    """
+    lines = (
+        _PROMPT_SPACE_RE.sub(' ', line).strip()
+        for line in text.splitlines()
+    )
+    return '\n'.join(line for line in lines if line)
+
+
+class _ResponseCache:
+    """Thread-safe LRU of LLM replies keyed by a hash of the request messages.
+    
+    LangChain's global LLM cache is bypassed by ``stream()``, so replies are
+    cached here. Only final text replies are stored: a reply with tool calls
+    would replay state-changing tools without the model deciding again. A
+    trailing user message is keyed with its whitespace collapsed, so prompts
+    that differ only in spacing share a reply.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(messages: List) -> str:
+        from langchain_core.load import dumps
+        from langchain_core.messages import HumanMessage
+        
+        *prefix, last = messages
+        if isinstance(last, HumanMessage) and isinstance(last.content, str):
+            tail = _normalize_prompt(last.content)
+        else:
+            tail = dumps(last)
+        return hashlib.sha256((dumps(prefix) + tail).encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            message = self._entries.get(key)
+            if message is not None:
+                self._entries.move_to_end(key)
+            return message
+    
+    def put(self, key: str, message: Any) -> None:
+        with self._lock:
+            self._entries[key] = message
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_response_cache() -> _ResponseCache:
+    """LLM reply cache shared by all sessions (size from chat.response_cache_size)."""
+    return _ResponseCache(config.get('chat.response_cache_size', 128))
+
+
+def _stream_message(llm, messages: List):
+    """Stream an LLM reply, yielding its text as it arrives.
+    
+    Returns (via StopIteration) the full message, aggregated from the chunks so
+    tool calls can be inspected once the stream ends. Repeated requests whose
+    reply was plain text are answered from the response cache without calling
+    the LLM.
+    """
+    cache = _get_response_cache()
+    key = cache.key(messages) if cache.maxsize > 0 else None
+    
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            text = _extract_text(cached.content)
+            if text:
+                yield text
+            return cached
+    
+    message = None
+    for chunk in llm.stream(messages):
+        message = chunk if message is None else message + chunk
+        text = _extract_text(chunk.content)
+        if text:
+            yield text
+    
+    if key is not None and message is not None and not message.tool_calls:
+        cache.put(key, message)
+    return message
+
+
+def _buffer_stream(pieces: Iterator[str], interval: float = _STREAM_FLUSH_INTERVAL) -> Iterator[str]:
+    """Coalesce streamed text so the UI updates at most once per interval."""
+    buffer = []
+    last_flush = time.monotonic()
+    for piece in pieces:
+        buffer.append(piece)
+        now = time.monotonic()
+        if now - last_flush >= interval:
+            yield ''.join(buffer)
+            buffer.clear()
+            last_flush = now
+    if buffer:
+        yield ''.join(buffer)
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file (orjson when installed)."""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write a JSON file indented by 2 spaces (orjson when installed)."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize data as JSON indented by 2 spaces (orjson when installed)."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Load a JSON file, returning None if it is missing or unreadable."""
+    try:
+        return _read_json(path)
+    except Exception:
+        return None
+
+
+def _load_json_batch(paths: List[Path],
+                     loader: Callable[[Path], Optional[Dict[str, Any]]] = _load_json
+                     ) -> List[Optional[Dict[str, Any]]]:
+    """Load several JSON files concurrently (I/O bound), preserving order."""
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(paths))) as executor:
+        return list(executor.map(loader, paths))
+
+
+class _ChatLog:
+    """SQLite store of chat transcripts, keyed by session id.
+    
+    Sessions keep only their most recent messages in memory; older ones are
+    read back from here when the user scrolls up or downloads the chat. Each
+    session keeps at most ``max_messages`` rows, and rows older than
+    ``retention_hours`` are deleted by expire(). With no path the store is
+    in-memory, so nothing is written to disk. One connection is shared by all
+    sessions, so access is serialized by a lock.
+    """
+    
+    def __init__(self, path: Optional[Path], max_messages: int, retention_hours: float):
+        self.max_messages = max_messages
+        self.retention_hours = retention_hours
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path) if path else ":memory:", check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS messages ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL, "
+                "role TEXT NOT NULL, content TEXT NOT NULL, ts TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_session ON messages (session_id, id)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_ts ON messages (ts)")
+    
+    def append(self, session_id: str, role: str, content: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO messages (session_id, role, content, ts) VALUES (?, ?, ?, ?)",
+                (session_id, role, content, datetime.now().isoformat())
+            )
+            self._conn.execute(
+                "DELETE FROM messages WHERE session_id = ? AND id <= ("
+                "SELECT id FROM messages WHERE session_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (session_id, session_id, self.max_messages)
+            )
+    
+    def tail(self, session_id: str, limit: int) -> List[Dict[str, str]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT role, content FROM messages WHERE session_id = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (session_id, limit)
+            ).fetchall()
+        return [{"role": role, "content": content} for role, content in reversed(rows)]
+    
+    def dump(self, session_id: str) -> bytes:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT role, content FROM messages WHERE session_id = ? ORDER BY id",
+                (session_id,)
+            ).fetchall()
+        return _dumps_json([{"role": role, "content": content} for role, content in rows])
+    
+    def clear(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+    
+    def expire(self) -> None:
+        """Delete messages older than the retention period, from every session."""
+        cutoff = (datetime.now() - timedelta(hours=self.retention_hours)).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM messages WHERE ts < ?", (cutoff,))
+
+
+@st.cache_resource(show_spinner=False)
+def _get_chat_log() -> _ChatLog:
+    """Chat transcript store shared by all sessions.
+    
+    Written under paths.chat.history_dir when chat.history_enabled is set,
+    otherwise kept in memory. Expired sessions are swept on startup.
+    """
+    path = None
+    if config.get('chat.history_enabled', True):
+        path = config.get_path('paths.chat.history_dir') / 'web_chat.sqlite3'
+    chat_log = _ChatLog(
+        path,
+        max_messages=max(1, config.get('chat.max_history', 100)),
+        retention_hours=config.get('chat.history_retention_hours', 24)
+    )
+    chat_log.expire()
+    return chat_log
+
+
+@st.cache_resource(show_spinner=False)
+def _case_metadata_cache() -> Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]]:
+    """Parsed case metadata keyed by path, shared by all sessions.
+    
+    Entries carry the file's (mtime_ns, size) and are only reused while it
+    still matches, so case scans re-read just the files that changed.
+    """
+    return {}
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Get a file's (mtime_ns, size), or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_metadata_loader(cache: Dict) -> Callable[[Path], Optional[Dict[str, Any]]]:
+    """Build a metadata loader that consults and fills the given cache."""
+    def load(path: Path) -> Optional[Dict[str, Any]]:
+        signature = _file_signature(path)
+        if signature is None:
+            return None
+        cached = cache.get(str(path))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        metadata = _load_json(path)
+        if metadata is not None:
+            cache[str(path)] = (signature, metadata)
+        return metadata
+    return load
+
+
+def _remember_case_metadata(path: Path, metadata: Dict[str, Any]) -> None:
+    """Seed the metadata cache with a file just written, skipping its re-read."""
+    signature = _file_signature(path)
+    if signature is not None:
+        _case_metadata_cache()[str(path)] = (signature, metadata)
+
+
+def _dir_mtime(directory: Path) -> float:
+    """Get a directory's mtime for use as a cache key (0.0 if missing)."""
+    try:
+        return directory.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _scan_cases(cases_dir: str, mtime: float) -> List[Dict[str, Any]]:
+    """Scan case folders and parse their metadata.
+    
+    Cached per (cases_dir, mtime) so reruns skip the disk walk until a case
+    folder is added or removed. In-place metadata edits don't change the
+    folder mtime, so code that writes them calls _invalidate_scans().
+    
+    Returns:
+        List of dicts with 'case_reference', 'mtime', 'metadata' (None if
+        missing or unreadable), 'has_metadata' and 'file_count' keys
+    """
+    cases_path = Path(cases_dir)
+    if not cases_path.exists():
+        return []
+    
+    # DirEntry caches is_dir()/stat() results, saving a syscall per case
+    with os.scandir(cases_path) as entries:
+        case_entries = [entry for entry in entries if entry.is_dir()]
+    case_dirs = [Path(entry.path) for entry in case_entries]
+    metadata_files = [d / "case_metadata.json" for d in case_dirs]
+    metadatas = _load_json_batch(
+        metadata_files, _cached_metadata_loader(_case_metadata_cache())
+    )
+    
+    cases = []
+    for entry, case_dir, metadata_file, metadata in zip(case_entries, case_dirs, metadata_files, metadatas):
+        record = {
+            "case_reference": entry.name,
+            "mtime": entry.stat().st_mtime,
+            "metadata": metadata,
+            "has_metadata": metadata is not None or metadata_file.exists(),
+            "file_count": 0
+        }
+        
+        if not record["has_metadata"]:
+            # Count non-JSON files in a single directory pass
+            with os.scandir(case_dir) as entries:
+                record["file_count"] = sum(
+                    1 for entry in entries
+                    if entry.is_file() and not entry.name.endswith('.json')
+                )
+        
+        cases.append(record)
+    
+    return cases
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _scan_documents(intake_dir: str, mtime: float) -> List[Dict[str, Any]]:
+    """Scan intake document metadata files.
+    
+    Cached per (intake_dir, mtime) like _scan_cases.
+    
+    Returns:
+        List of dicts with 'name', 'mtime' and 'metadata' keys; unreadable
+        files are skipped
+    """
+    intake_path = Path(intake_dir)
+    if not intake_path.exists():
+        return []
+    
+    with os.scandir(intake_path) as entries:
+        metadata_entries = [
+            entry for entry in entries
+            if entry.name.endswith('.metadata.json') and entry.is_file()
+        ]
+    metadata_files = [Path(entry.path) for entry in metadata_entries]
+    
+    documents = []
+    for entry, metadata in zip(metadata_entries, _load_json_batch(metadata_files)):
+        if metadata is None:
+            continue
+        documents.append({
+            "name": entry.name,
+            "mtime": entry.stat().st_mtime,
+            "metadata": metadata
+        })
+    
+    return documents
+
+
+def _invalidate_scans() -> None:
+    """Drop cached case and document listings after metadata files change in place.
+    
+    The rescan is cheap: unchanged metadata files are served from
+    _cached_metadata_loader's per-file (mtime_ns, size) cache.
+    """
+    _scan_cases.clear()
+    _scan_documents.clear()
+
+
+@st.cache_data(show_spinner=False)
+def _banner(kind: str = 'web') -> Dict[str, str]:
+    """Banner text from config/ui_messages.json, loaded once per process."""
+    from utilities import get_banner_text
+    return get_banner_text(kind)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_pipeline_executor() -> ThreadPoolExecutor:
+    """Background executor for pipeline runs, shared by all sessions.
+    
+    A single worker keeps runs serialized: the pipeline rebuilds one on-disk
+    processing queue per run, so overlapping runs would interfere.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="kyc_pipeline")
+
+
+def _import_pipeline():
+    """Import the pipeline modules so the first upload doesn't pay for it."""
+    try:
+        import pipeline_flow  # noqa: F401
+    except Exception as e:
+        logger.warning(f"Pipeline warm-up failed: {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_pipeline() -> Future:
+    """Start the pipeline warm-up on the pipeline executor, once per process."""
+    return _get_pipeline_executor().submit(_import_pipeline)
+
+
+def _run_upload_batch(staging_dir: str, file_count: int,
+                      case_ref: Optional[str]) -> Dict[str, Any]:
+    """Run the pipeline over a staged upload folder (on the pipeline executor)."""
+    from pipeline_flow import run_pipeline_sync
+    
+    try:
+        # Process the whole batch in one pipeline run over the folder
+        result = run_pipeline_sync(input_path=staging_dir, case_reference=case_ref)
+        all_results = [result]
+        
+        # Aggregate results
+        total_docs = sum(r.get('processed', 0) + r.get('succeeded', 0) for r in all_results)
+        failed_docs = sum(r.get('failed', 0) for r in all_results)
+        linked_docs = []
+        for r in all_results:
+            linked_docs.extend(r.get('linked_documents', []))
+        
+        return {
+            "success": failed_docs == 0,
+            "files_processed": file_count,
+            "documents_created": total_docs,
+            "documents_linked": len(linked_docs),
+            "case_reference": case_ref,
+            "results": all_results
+        }
+        
+    except Exception as e:
+        logger.error(f"Error processing files: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_llm():
+    """Create the chat LLM once per process and share it across sessions."""
+    from utilities.llm_factory import create_llm
+    return create_llm()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_llm_tools(_chat_interface) -> Dict[str, Any]:
+    """Create the chat tools and tool-bound LLM once per process.
+    
+    Tools only reach case state through the interface, which is backed by
+    st.session_state, so one set serves every session. The leading
+    underscore keeps the interface out of the cache key.
+    """
+    from tools.chat_tools import create_chat_tools
+    tools = create_chat_tools(_chat_interface)
+    return {
+        "tools": tools,
+        "tools_by_name": {t.name: t for t in tools},
+        "llm_with_tools": _get_llm().bind_tools(tools)
+    }
 
 
 class WebChatInterface:
@@ -117,7 +759,6 @@ class WebChatInterface:
     
     def __init__(self):
         """Initialize the web chat interface."""
-        self.case_reference: Optional[str] = None
         self._initialize_session_state()
     
     def _initialize_session_state(self):
@@ -125,17 +766,26 @@ class WebChatInterface:
         # Core state
         if 'initialized' not in st.session_state:
             st.session_state.initialized = False
-            st.session_state.llm = None
             st.session_state.supervisor = None
-            st.session_state.tools = None
-            st.session_state.llm_with_tools = None
         
         # Chat state
         if 'messages' not in st.session_state:
             st.session_state.messages = []
         
+        # Full transcript lives in the chat log; messages holds its tail
+        if 'chat_session_id' not in st.session_state:
+            st.session_state.chat_session_id = uuid.uuid4().hex
+            st.session_state.message_count = 0
+            _get_chat_log().expire()
+        
         if 'conversation_history' not in st.session_state:
-            st.session_state.conversation_history = []
+            st.session_state.conversation_history = deque()
+        
+        if 'history_summary' not in st.session_state:
+            st.session_state.history_summary = ""
+        
+        if 'msg_window' not in st.session_state:
+            st.session_state.msg_window = _MESSAGE_WINDOW
         
         # Case state
         if 'case_reference' not in st.session_state:
@@ -156,8 +806,12 @@ class WebChatInterface:
         if 'pending_user_message' not in st.session_state:
             st.session_state.pending_user_message = None
         
-        # Sync case_reference
-        self.case_reference = st.session_state.case_reference
+        # Background upload jobs and the last finished job's result
+        if 'pending_jobs' not in st.session_state:
+            st.session_state.pending_jobs = []
+        
+        if 'upload_notice' not in st.session_state:
+            st.session_state.upload_notice = None
     
     def initialize_system(self) -> bool:
         """Initialize LLM, supervisor, and tools."""
@@ -166,15 +820,17 @@ class WebChatInterface:
         
         try:
             with st.spinner("🔄 Initializing AI system..."):
-                # Create LLM
-                st.session_state.llm = create_llm()
+                # LLM and tools are shared process-wide
+                llm = _get_llm()
+                _get_llm_tools(self)
                 
-                # Create supervisor (pass self for case_reference access)
-                st.session_state.supervisor = SupervisorAgent(chat_interface=self)
+                # Supervisor holds per-user plan state, so keep one per session,
+                # but share the cached LLM client instead of building a new one
+                from agents.supervisor_agent import SupervisorAgent
+                st.session_state.supervisor = SupervisorAgent(chat_interface=self, llm=llm)
                 
-                # Create tools
-                st.session_state.tools = create_chat_tools(self)
-                st.session_state.llm_with_tools = st.session_state.llm.bind_tools(st.session_state.tools)
+                # Load the pipeline in the background before the first upload
+                _warm_pipeline()
                 
                 st.session_state.initialized = True
                 return True
@@ -184,18 +840,45 @@ class WebChatInterface:
             logger.error(f"Web chat initialization failed: {e}")
             return False
     
+    @property
+    def case_reference(self) -> Optional[str]:
+        """Active case reference for the current session."""
+        return st.session_state.get('case_reference')
+    
+    @case_reference.setter
+    def case_reference(self, case_ref: Optional[str]):
+        st.session_state.case_reference = case_ref
+    
     @property
     def llm(self):
-        """Access the LLM from session state for use in tools."""
-        return st.session_state.get('llm')
+        """Access the shared LLM for use in tools."""
+        return _get_llm() if st.session_state.get('initialized') else None
+    
+    @property
+    def tools(self) -> Optional[List]:
+        """Access the shared chat tools."""
+        return _get_llm_tools(self)["tools"] if st.session_state.get('initialized') else None
+    
+    @property
+    def tools_by_name(self) -> Dict[str, Any]:
+        """Shared chat tools keyed by tool name."""
+        return _get_llm_tools(self)["tools_by_name"] if st.session_state.get('initialized') else {}
+    
+    @property
+    def llm_with_tools(self):
+        """Access the shared tool-bound LLM."""
+        return _get_llm_tools(self)["llm_with_tools"] if st.session_state.get('initialized') else None
     
     def set_case_reference(self, case_ref: str) -> str:
         """Set active case reference and create if new."""
         case_ref = case_ref.strip().upper().replace('-', '_')
         
-        # Update both local and session state
+        # Already active - nothing to check or write
+        if case_ref == self.case_reference:
+            return f"✅ Already using case: `{case_ref}`"
+        
+        # Update session state
         self.case_reference = case_ref
-        st.session_state.case_reference = case_ref
         
         # Check if case exists
         case_dir = Path(settings.documents_dir) / "cases" / case_ref
@@ -214,8 +897,12 @@ class WebChatInterface:
                 "description": "",
                 "documents": []
             }
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            _write_json(metadata_file, metadata)
+            _remember_case_metadata(metadata_file, metadata)
+            
+            # New case folder - drop cached case listings; the rescan
+            # reuses cached metadata instead of re-reading every case
+            _scan_cases.clear()
             
             return f"✅ Created new case: `{case_ref}`"
     
@@ -223,218 +910,217 @@ class WebChatInterface:
         """Detect if user message contains multiple commands."""
         message_lower = user_message.lower()
         
-        action_keywords = [
-            'create', 'switch', 'process', 'classify', 'extract',
-            'summarize', 'summary', 'list', 'status', 'add', 'upload'
-        ]
-        
-        action_count = sum(1 for kw in action_keywords if kw in message_lower)
-        chain_indicators = [' and ', ' then ', ', then', ' after ', ' finally ']
-        has_chain = any(ind in message_lower for ind in chain_indicators)
+        # Count distinct actions in a single pass
+        action_count = len(set(_ACTION_RE.findall(message_lower)))
+        has_chain = _CHAIN_RE.search(message_lower) is not None
         
         return action_count >= 2 or (has_chain and action_count >= 1)
     
     def get_response(self, user_message: str) -> str:
         """Get response from LLM or supervisor - matching CLI capabilities."""
-        if not st.session_state.llm:
-            return "❌ System not initialized. Please refresh the page."
+        return ''.join(self.stream_response(user_message))
+    
+    def stream_response(self, user_message: str) -> Iterator[str]:
+        """Yield the response to a user message, streaming LLM text as it arrives."""
+        from langchain_core.messages import HumanMessage, AIMessage
+        
+        if not self.llm:
+            yield "❌ System not initialized. Please refresh the page."
+            return
         
         try:
             # First, check for quick commands (no LLM needed)
             quick_response = self._handle_quick_command(user_message)
             if quick_response:
-                return quick_response
+                yield quick_response
+                return
             
             # Check for multi-step command that needs orchestration
             if st.session_state.supervisor and self._is_multi_step_command(user_message):
                 logger.info("Multi-step command detected, routing to supervisor")
-                return st.session_state.supervisor.process_command(user_message)
+                result = st.session_state.supervisor.process_command(user_message)
+                # Supervisor workflows create, link and process documents
+                _invalidate_scans()
+                yield result
+                return
             
             # Single-step: use LLM with tools
             context = f"\nCurrent case: {st.session_state.case_reference or 'Not set'}"
-            st.session_state.conversation_history.append(
-                HumanMessage(content=user_message + context)
-            )
+            human_message = HumanMessage(content=user_message + context)
             
-            # Build message list with system prompt (trim to last 20 messages)
-            system_prompt = self._get_system_prompt()
-            messages = [SystemMessage(content=system_prompt)] + st.session_state.conversation_history[-20:]
+            # Static system prompt, then committed history (at most _HISTORY_WINDOW
+            # messages), then this turn - earlier entries are never edited, so the request
+            # prefix matches the previous turn's for provider prompt caching
+            messages = [
+                _system_message(st.session_state.history_summary),
+                *st.session_state.conversation_history,
+                human_message
+            ]
             
-            # Get LLM response
-            response = st.session_state.llm_with_tools.invoke(messages)
+            # Stream LLM response
+            response = yield from _stream_message(self.llm_with_tools, messages)
             
             # Handle tool calls in a loop (like CLI)
             if hasattr(response, 'tool_calls') and response.tool_calls:
-                return self._execute_tools(response, messages)
-            
-            # Regular response - extract text from content
-            if isinstance(response.content, list):
-                text_parts = []
-                for block in response.content:
-                    if isinstance(block, dict) and block.get('type') == 'text':
-                        text_parts.append(block.get('text', ''))
-                    elif isinstance(block, str):
-                        text_parts.append(block)
-                assistant_message = '\n'.join(text_parts)
-            elif isinstance(response.content, str):
-                assistant_message = response.content
+                assistant_message = yield from self._execute_tools(response, messages)
             else:
-                assistant_message = str(response.content)
+                # Regular response - extract text from content
+                assistant_message = _extract_text(response.content)
             
-            st.session_state.conversation_history.append(
-                AIMessage(content=assistant_message)
-            )
-            return assistant_message
+            # Commit the turn only once it succeeded, as a user/assistant pair
+            history = st.session_state.conversation_history
+            history.extend((human_message, AIMessage(content=assistant_message)))
+            self._compact_history()
             
         except Exception as e:
             logger.error(f"Error getting response: {e}")
-            return f"❌ Error: {str(e)}"
+            yield f"❌ Error: {str(e)}"
+    
+    def _compact_history(self):
+        """Fold the oldest history into the summary once it outgrows its limits.
+        
+        Compaction triggers past _HISTORY_WINDOW messages or _HISTORY_TOKEN_BUDGET
+        estimated tokens and trims to half of each, in one block so the request
+        prefix stays identical between compactions for provider prompt caching.
+        The kept history always starts at a user message.
+        """
+        from langchain_core.messages import HumanMessage
+        
+        history = st.session_state.conversation_history
+        tokens = sum(_estimate_tokens(message) for message in history)
+        if len(history) <= _HISTORY_WINDOW and tokens <= _HISTORY_TOKEN_BUDGET:
+            return
+        
+        dropped = []
+        while len(history) > 2 and (
+            len(history) > _HISTORY_WINDOW // 2
+            or tokens > _HISTORY_TOKEN_BUDGET // 2
+            or not isinstance(history[0], HumanMessage)
+        ):
+            message = history.popleft()
+            tokens -= _estimate_tokens(message)
+            dropped.append(message)
+        
+        st.session_state.history_summary = self._summarize_history(dropped)
+    
+    def _summarize_history(self, dropped: List) -> str:
+        """Merge dropped messages into the running summary (kept as-is on failure)."""
+        from langchain_core.messages import HumanMessage, SystemMessage
+        
+        previous = st.session_state.history_summary
+        transcript = "\n".join(
+            f"{'User' if isinstance(message, HumanMessage) else 'Assistant'}: {_extract_text(message.content)}"
+            for message in dropped
+        )
+        if previous:
+            transcript = f"Earlier summary:\n{previous}\n\n{transcript}"
+        
+        try:
+            response = self.llm.invoke([
+                SystemMessage(content=_SUMMARY_PROMPT),
+                HumanMessage(content=transcript)
+            ])
+            return _extract_text(response.content)
+        except Exception as e:
+            logger.warning(f"Conversation summary failed: {e}")
+            return previous
     
     def _get_system_prompt(self) -> str:
         """Get comprehensive system prompt for LLM - matching CLI capabilities."""
-        return """You are an intelligent KYC-AML Document Processing Assistant powered by CrewAI pipeline agents.
-
-Your Role:
-- Assist with document processing, classification, and data extraction
-- Support both case-based workflows (KYC/AML compliance) and general document processing
-- Help manage customer onboarding cases when needed
-- Process standalone documents without requiring case references
-- Resume processing for documents that have pending stages
-
-Your Pipeline Agents:
-You have 5 specialized agents working together:
-1. **QueueAgent**: Scans input paths, expands folders, splits PDFs into pages, builds the processing queue
-2. **ClassificationAgent**: Classifies documents via REST API (passport, license, utility bill, PAN, Aadhaar, etc.)
-3. **ExtractionAgent**: Extracts structured data from documents via REST API
-4. **MetadataAgent**: Tracks status, handles errors, manages retries
-5. **SummaryAgent**: Generates processing reports and statistics
-
-Your Capabilities:
-You have access to specialized tools to:
-1. Process documents WITHOUT requiring a case reference - documents get globally unique IDs
-2. Link processed documents to cases when needed (many-to-many relationships supported)
-3. List and switch between customer cases (e.g., KYC_2026_001)
-4. Check case status with detailed metadata (workflow stage, document types, extracted data)
-5. Browse all documents in the system, filtered by stage or case
-6. Retrieve specific documents by their unique ID
-7. **Run the full pipeline** on files or folders
-8. **Resume processing** for existing documents by their document ID
-9. **Find documents by ID** across all cases
-
-Document Processing Workflows:
-A. CASE-AGNOSTIC: User provides document → Process immediately → Get unique document ID → Optionally link to case later
-B. CASE-BASED: User provides case + document → Process and auto-link to case
-C. **PIPELINE RUN**: User provides folder path → Queue all files → Classify → Extract → Generate summary
-D. **RESUME PROCESSING**: User provides document ID (DOC_...) → Load metadata → Resume from pending stage
-
-IMPORTANT: 
-- When a user provides a document path without mentioning a case, process it immediately WITHOUT asking for a case reference
-- When a user provides a document ID (starts with "DOC_"), use find_document_by_id or process_document_by_id
-- When a user provides a folder, use run_document_pipeline to process all documents
-- Documents can always be linked to cases later if needed
-- Never block document processing by requiring a case upfront
-
-Communication Style:
-- Professional yet friendly - be helpful and efficient
-- Clear and concise - users value quick results
-- Proactive - suggest linking to cases AFTER processing, not before
-- Transparent - explain what the pipeline agents are doing
-- Use Markdown formatting for readability
-
-Always prioritize efficiency and flexibility. Documents are first-class entities that can exist independently of cases."""
+        return _SYSTEM_PROMPT
     
-    def _execute_tools(self, response, messages: List) -> str:
-        """Execute tool calls from LLM response in a loop until no more tool calls."""
-        # Append initial response with tool calls
-        messages.append(response)
+    def _execute_tools(self, response, messages: List):
+        """Execute tool calls in a loop until no more, streaming the LLM's text.
+        
+        Returns (via StopIteration) the final response text.
+        """
+        from langchain_core.messages import AIMessage, ToolMessage
+        
+        tools_by_name = self.tools_by_name
+        
+        # Each exchange is [AIMessage with tool calls, ToolMessage, ...]. Only the
+        # last few are re-sent in full so long tool chains don't resend every result.
+        exchanges = []
+        condensed = []
         
         while hasattr(response, 'tool_calls') and response.tool_calls:
+            # Separate any text already streamed from what follows the tools
+            if _extract_text(response.content):
+                yield "\n\n"
+            
+            exchange = [response]
             for tool_call in response.tool_calls:
                 tool_name = tool_call['name']
                 tool_args = tool_call['args']
                 tool_id = tool_call.get('id', tool_name)
                 
                 # Find and execute tool
-                tool = next((t for t in st.session_state.tools if t.name == tool_name), None)
+                tool = tools_by_name.get(tool_name)
                 if tool:
                     try:
                         result = tool.invoke(tool_args)
-                        messages.append(
-                            ToolMessage(content=str(result), tool_call_id=tool_id)
+                        exchange.append(
+                            ToolMessage(content=str(result), tool_call_id=tool_id, name=tool_name)
                         )
                     except Exception as e:
                         logger.error(f"Tool {tool_name} error: {e}")
-                        messages.append(
-                            ToolMessage(content=f"Error: {str(e)}", tool_call_id=tool_id)
+                        exchange.append(
+                            ToolMessage(content=f"Error: {str(e)}", tool_call_id=tool_id, name=tool_name)
                         )
                 else:
-                    messages.append(
-                        ToolMessage(content=f"Tool {tool_name} not found", tool_call_id=tool_id)
+                    exchange.append(
+                        ToolMessage(content=f"Tool {tool_name} not found", tool_call_id=tool_id, name=tool_name)
                     )
             
-            # Get next response (may have more tool calls)
-            response = st.session_state.llm_with_tools.invoke(messages)
-            if hasattr(response, 'tool_calls') and response.tool_calls:
-                messages.append(response)
+            # Tools may link documents or rewrite metadata in place
+            _invalidate_scans()
+            
+            exchanges.append(exchange)
+            if len(exchanges) > _MAX_TOOL_EXCHANGES:
+                # Collapse the oldest round into one-line result previews
+                for tool_message in exchanges.pop(0)[1:]:
+                    condensed.append(
+                        f"- {tool_message.name}: {str(tool_message.content)[:_CONDENSED_RESULT_CHARS]}"
+                    )
+            
+            request = list(messages)
+            if condensed:
+                request.append(AIMessage(content="Earlier tool results:\n" + "\n".join(condensed)))
+            for recent in exchanges:
+                request.extend(recent)
+            
+            # Stream next response (may have more tool calls)
+            response = yield from _stream_message(self.llm_with_tools, request)
         
         # Final response - extract text content
-        if isinstance(response.content, list):
-            text_parts = []
-            for block in response.content:
-                if isinstance(block, dict) and block.get('type') == 'text':
-                    text_parts.append(block.get('text', ''))
-                elif isinstance(block, str):
-                    text_parts.append(block)
-            assistant_message = '\n'.join(text_parts)
-        elif isinstance(response.content, str):
-            assistant_message = response.content
-        else:
-            assistant_message = str(response.content)
-        
-        # Add to conversation history
-        st.session_state.conversation_history.append(AIMessage(content=assistant_message))
-        
-        return assistant_message
+        return _extract_text(response.content)
     
     def _handle_quick_command(self, user_input: str) -> Optional[str]:
         """Handle common quick commands without LLM."""
         cmd = user_input.strip().lower()
         
-        # Exit commands (not applicable in web)
-        if cmd in ['exit', 'quit', 'bye', '/exit']:
-            return "👋 Use the browser to close this session."
-        
-        # Quick commands for cases and documents
-        if cmd in ['show cases', 'list cases', 'cases']:
-            return self._show_cases()
+        handler = _EXACT_COMMANDS.get(cmd)
+        if handler:
+            return getattr(self, handler)()
         
-        if cmd in ['show docs', 'list docs', 'docs', 'show documents', 'list documents']:
-            return self._show_documents()
-        
-        if cmd in ['status', 'show status']:
-            return self._show_status()
-        
-        # Handle "select case <case_id>" or "use case <case_id>"
-        if cmd.startswith('select case ') or cmd.startswith('use case '):
-            case_id = cmd.split(' ', 2)[-1].strip().upper()
-            return self.set_case_reference(case_id)
-        
-        # Handle "summarize case" or "summarize case <case_id>"
-        if cmd == 'summarize case' or cmd == 'summarize':
-            if st.session_state.case_reference:
-                return self._summarize_case(st.session_state.case_reference)
-            else:
-                return "❌ No case selected. Use 'select case <CASE_ID>' first or 'summarize case <CASE_ID>'"
-        
-        if cmd.startswith('summarize case '):
-            case_id = cmd.split(' ', 2)[-1].strip().upper()
-            return self._summarize_case(case_id)
-        
-        if cmd in ['help', '?', '/help']:
-            return self._show_help()
+        # Handle "select case <case_id>", "use case <case_id>", "summarize case <case_id>"
+        match = _PREFIX_COMMAND_RE.match(cmd)
+        if match:
+            case_id = match.group(2).strip().upper()
+            return getattr(self, _PREFIX_COMMANDS[match.group(1)])(case_id)
         
         return None
     
+    def _exit_hint(self) -> str:
+        """Exit commands are not applicable in the web UI."""
+        return "👋 Use the browser to close this session."
+    
+    def _summarize_current_case(self) -> str:
+        """Summarize the active case, if one is selected."""
+        if st.session_state.case_reference:
+            return self._summarize_case(st.session_state.case_reference)
+        return "❌ No case selected. Use 'select case <CASE_ID>' first or 'summarize case <CASE_ID>'"
+    
     def _show_cases(self, limit: int = 10) -> str:
         """Show recent cases with metadata summary."""
         cases_dir = Path(settings.documents_dir) / "cases"
@@ -442,38 +1128,33 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
         if not cases_dir.exists():
             return "📋 No cases found. Create one with: 'create case KYC_2026_001'"
         
-        case_dirs = sorted(
-            [d for d in cases_dir.iterdir() if d.is_dir()],
-            key=lambda x: x.stat().st_mtime,
+        cases = sorted(
+            _scan_cases(str(cases_dir), _dir_mtime(cases_dir)),
+            key=lambda x: x['mtime'],
             reverse=True
         )[:limit]
         
-        if not case_dirs:
+        if not cases:
             return "📋 No cases found. Create one with: 'create case KYC_2026_001'"
         
-        msg = f"📋 **Cases** (showing {len(case_dirs)}):\n\n"
+        msg = f"📋 **Cases** (showing {len(cases)}):\n\n"
         
-        for case_dir in case_dirs:
-            case_id = case_dir.name
+        for case in cases:
+            case_id = case['case_reference']
             is_current = " ← **ACTIVE**" if case_id == st.session_state.case_reference else ""
             
-            # Load case metadata if exists
-            metadata_file = case_dir / "case_metadata.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    doc_count = len(metadata.get('documents', []))
-                    status = metadata.get('status', 'unknown')
-                    created = metadata.get('created_date', '')[:10]
-                    msg += f"- 📁 `{case_id}`{is_current}\n"
-                    msg += f"  - 📄 {doc_count} docs | 📅 {created} | 🏷️ {status}\n\n"
-                except:
-                    msg += f"- 📁 `{case_id}`{is_current}\n\n"
+            metadata = case['metadata']
+            if metadata is not None:
+                doc_count = len(metadata.get('documents', []))
+                status = metadata.get('status', 'unknown')
+                created = metadata.get('created_date', '')[:10]
+                msg += f"- 📁 `{case_id}`{is_current}\n"
+                msg += f"  - 📄 {doc_count} docs | 📅 {created} | 🏷️ {status}\n\n"
+            elif case['has_metadata']:
+                msg += f"- 📁 `{case_id}`{is_current}\n\n"
             else:
-                doc_count = len(list(case_dir.glob("*.*"))) - len(list(case_dir.glob("*.json")))
                 msg += f"- 📁 `{case_id}`{is_current}\n"
-                msg += f"  - 📄 ~{max(0, doc_count)} files\n\n"
+                msg += f"  - 📄 ~{max(0, case['file_count'])} files\n\n"
         
         msg += "\n💡 Commands: `select case <ID>` | `show docs` | `create case <ID>`"
         return msg
@@ -485,22 +1166,20 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
         if not intake_dir.exists():
             return "📄 No documents found. Process some documents first."
         
-        metadata_files = sorted(
-            intake_dir.glob("*.metadata.json"),
-            key=lambda x: x.stat().st_mtime,
+        documents = sorted(
+            _scan_documents(str(intake_dir), _dir_mtime(intake_dir)),
+            key=lambda x: x['mtime'],
             reverse=True
         )[:limit]
         
-        if not metadata_files:
+        if not documents:
             return "📄 No documents found in intake. Process some documents first."
         
-        msg = f"📄 **Recent Documents** (showing {len(metadata_files)}):\n\n"
+        msg = f"📄 **Recent Documents** (showing {len(documents)}):\n\n"
         
-        for meta_file in metadata_files:
+        for document in documents:
             try:
-                with open(meta_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                
+                metadata = document['metadata']
                 doc_id = metadata.get('document_id', 'unknown')
                 doc_type = metadata.get('classification', {}).get('document_type', 'unclassified')
                 queue_status = metadata.get('queue', {}).get('status', 'unknown')
@@ -523,20 +1202,20 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
     def _show_status(self) -> str:
         """Show current system status."""
         msg = "📊 **System Status**\n\n"
-        msg += f"- 🤖 LLM: {'✅ Connected' if st.session_state.llm else '❌ Not connected'}\n"
+        msg += f"- 🤖 LLM: {'✅ Connected' if self.llm else '❌ Not connected'}\n"
         msg += f"- ⚙️ Supervisor: {'✅ Ready' if st.session_state.supervisor else '❌ Not initialized'}\n"
         msg += f"- 📁 Active Case: `{st.session_state.case_reference or 'None selected'}`\n\n"
         
-        # Count documents in intake
+        # Count documents in intake (from the cached scan)
         intake_dir = Path(settings.documents_dir) / "intake"
         if intake_dir.exists():
-            doc_count = len(list(intake_dir.glob("*.metadata.json")))
+            doc_count = len(_scan_documents(str(intake_dir), _dir_mtime(intake_dir)))
             msg += f"- 📄 Documents in intake: {doc_count}\n"
         
-        # Count cases
+        # Count cases (from the cached scan)
         cases_dir = Path(settings.documents_dir) / "cases"
         if cases_dir.exists():
-            case_count = len([d for d in cases_dir.iterdir() if d.is_dir()])
+            case_count = len(_scan_cases(str(cases_dir), _dir_mtime(cases_dir)))
             msg += f"- 📋 Total cases: {case_count}\n"
         
         msg += "\n💡 Commands: `show cases` | `show docs` | `help`"
@@ -593,63 +1272,59 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
     
     def _show_help(self) -> str:
         """Show help message from config."""
-        from utilities import get_capabilities_text, get_banner_text
-        banner = get_banner_text('web')
+        from utilities import get_capabilities_text
+        banner = _banner('web')
         return f"# 📖 {banner['app_name']} - Help\n\n" + get_capabilities_text('web')
     
-    def process_uploaded_files(self, uploaded_files, case_ref: Optional[str] = None) -> Dict[str, Any]:
-        """Process uploaded files through the pipeline."""
-        if not uploaded_files:
-            return {"success": False, "error": "No files provided"}
+    def submit_uploaded_files(self, uploaded_files, case_ref: Optional[str] = None) -> Future:
+        """Stage uploaded files and queue them for background pipeline processing.
         
+        Returns:
+            Future resolving to the same result dict as process_uploaded_files
+        """
         # Use provided case or current case
         case_ref = case_ref or st.session_state.case_reference
         
-        # Save uploaded files to temp directory
-        temp_dir = Path("temp_uploads")
-        temp_dir.mkdir(exist_ok=True)
-        
-        file_paths = []
-        for uploaded_file in uploaded_files:
-            file_path = temp_dir / uploaded_file.name
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            file_paths.append(str(file_path))
+        # Check size and type up front so rejected files are never written
+        rejected = [
+            f"{f.name} ({reason})" for f in uploaded_files
+            if (reason := _upload_rejection(f))
+        ]
+        if rejected:
+            raise ValueError(f"Files rejected: {', '.join(rejected)}")
         
+        # Stage uploads in a private temp directory, removed once the job is done
+        staging = tempfile.TemporaryDirectory(prefix="kyc_up_")
+        staging_dir = Path(staging.name)
         try:
-            # Process each file through pipeline
-            all_results = []
-            for file_path in file_paths:
-                result = run_pipeline_sync(input_path=file_path, case_reference=case_ref)
-                all_results.append(result)
-            
-            # Aggregate results
-            total_docs = sum(r.get('processed', 0) + r.get('succeeded', 0) for r in all_results)
-            failed_docs = sum(r.get('failed', 0) for r in all_results)
-            linked_docs = []
-            for r in all_results:
-                linked_docs.extend(r.get('linked_documents', []))
-            
-            return {
-                "success": failed_docs == 0,
-                "files_processed": len(file_paths),
-                "documents_created": total_docs,
-                "documents_linked": len(linked_docs),
-                "case_reference": case_ref,
-                "results": all_results
-            }
+            # Each upload has its own handle and target file, so writes can overlap
+            with ThreadPoolExecutor(max_workers=min(_UPLOAD_WORKERS, len(uploaded_files))) as executor:
+                list(executor.map(
+                    lambda indexed: _save_upload(staging_dir, *indexed), enumerate(uploaded_files)
+                ))
             
+            future = _get_pipeline_executor().submit(
+                _run_upload_batch, staging.name, len(uploaded_files), case_ref
+            )
+        except Exception:
+            staging.cleanup()
+            raise
+        
+        # Done-callbacks run after the result is published, so the UI sees
+        # completion without waiting on the staged files' removal
+        future.add_done_callback(lambda _: staging.cleanup())
+        return future
+    
+    def process_uploaded_files(self, uploaded_files, case_ref: Optional[str] = None) -> Dict[str, Any]:
+        """Process uploaded files through the pipeline and wait for the result."""
+        if not uploaded_files:
+            return {"success": False, "error": "No files provided"}
+        
+        try:
+            return self.submit_uploaded_files(uploaded_files, case_ref).result()
         except Exception as e:
             logger.error(f"Error processing files: {e}")
             return {"success": False, "error": str(e)}
-        
-        finally:
-            # Cleanup temp files
-            for file_path in file_paths:
-                try:
-                    os.remove(file_path)
-                except:
-                    pass
     
     def get_cases(self) -> List[Dict[str, Any]]:
         """Get all cases with their metadata."""
@@ -658,26 +1333,17 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
             return []
         
         cases = []
-        for case_dir in sorted(cases_dir.iterdir(), reverse=True):
-            if not case_dir.is_dir():
-                continue
-            
-            metadata_file = case_dir / "case_metadata.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file, encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    cases.append(metadata)
-                except:
-                    cases.append({
-                        "case_reference": case_dir.name,
-                        "status": "unknown",
-                        "documents": []
-                    })
+        for case in sorted(
+            _scan_cases(str(cases_dir), _dir_mtime(cases_dir)),
+            key=lambda x: x['case_reference'],
+            reverse=True
+        ):
+            if case['metadata'] is not None:
+                cases.append(case['metadata'])
             else:
                 cases.append({
-                    "case_reference": case_dir.name,
-                    "status": "no_metadata",
+                    "case_reference": case['case_reference'],
+                    "status": "unknown" if case['has_metadata'] else "no_metadata",
                     "documents": []
                 })
         
@@ -685,14 +1351,10 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
     
     def get_case_details(self, case_ref: str) -> Optional[Dict[str, Any]]:
         """Get detailed case information."""
-        case_dir = Path(settings.documents_dir) / "cases" / case_ref
-        metadata_file = case_dir / "case_metadata.json"
+        metadata_file = Path(settings.documents_dir) / "cases" / case_ref / "case_metadata.json"
         
-        if not metadata_file.exists():
-            return None
-        
-        with open(metadata_file, encoding='utf-8') as f:
-            return json.load(f)
+        # Shared with case scans; re-read only when the file changes
+        return _cached_metadata_loader(_case_metadata_cache())(metadata_file)
     
     def get_documents(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent documents from intake."""
@@ -700,16 +1362,13 @@ Always prioritize efficiency and flexibility. Documents are first-class entities
         if not intake_dir.exists():
             return []
         
-        documents = []
-        for metadata_file in sorted(intake_dir.glob("*.metadata.json"), reverse=True)[:limit]:
-            try:
-                with open(metadata_file, encoding='utf-8') as f:
-                    metadata = json.load(f)
-                documents.append(metadata)
-            except:
-                continue
+        documents = sorted(
+            _scan_documents(str(intake_dir), _dir_mtime(intake_dir)),
+            key=lambda x: x['name'],
+            reverse=True
+        )[:limit]
         
-        return documents
+        return [document['metadata'] for document in documents]
 
 
 def render_sidebar(chat: WebChatInterface):
@@ -718,6 +1377,7 @@ def render_sidebar(chat: WebChatInterface):
         st.markdown("## 🎛️ Control Panel")
         
         # System status
+        from utilities.llm_factory import get_model_info
         model_name, provider = get_model_info() if st.session_state.initialized else ("Not initialized", "N/A")
         
         status_color = "🟢" if st.session_state.initialized else "🔴"
@@ -736,38 +1396,48 @@ def render_sidebar(chat: WebChatInterface):
         else:
             st.warning("No case selected")
         
-        # Case selection/creation
-        col1, col2 = st.columns(2)
-        with col1:
-            new_case = st.text_input(
-                "Case ID",
-                placeholder="KYC_2026_001",
-                label_visibility="collapsed"
-            )
-        with col2:
-            if st.button("Set Case", use_container_width=True):
-                if new_case:
-                    result = chat.set_case_reference(new_case)
-                    st.success(result)
-                    st.rerun()
-        
-        # Quick case list
-        cases = chat.get_cases()[:5]
-        if cases:
+        # Case selection/creation - a form submits the ID once, on Set Case
+        with st.form("set_case_form", clear_on_submit=True, border=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                new_case = st.text_input(
+                    "Case ID",
+                    placeholder="KYC_2026_001",
+                    label_visibility="collapsed"
+                )
+            with col2:
+                submitted = st.form_submit_button("Set Case", use_container_width=True)
+        
+        if submitted and new_case:
+            result = chat.set_case_reference(new_case)
+            st.success(result)
+            # Only a case switch changes anything outside this message
+            if chat.case_reference != current_case:
+                st.rerun()
+        
+        # Quick case list (one lookup shared with the statistics below)
+        all_cases = chat.get_cases()
+        if all_cases:
             st.markdown("**Recent Cases:**")
-            for case in cases:
+            # Resolve display fields up front, then lay out the rows
+            rows = []
+            for case in all_cases[:5]:
                 case_ref = case.get('case_reference', 'Unknown')
-                doc_count = len(case.get('documents', []))
-                is_current = case_ref == current_case
-                
+                rows.append((case_ref, len(case.get('documents') or ()), case_ref == current_case))
+            
+            for case_ref, doc_count, is_current in rows:
                 col1, col2 = st.columns([3, 1])
                 with col1:
                     if is_current:
                         st.markdown(f"📂 **`{case_ref}`** ← Current")
                     else:
-                        if st.button(f"📁 `{case_ref}`", key=f"case_{case_ref}"):
-                            chat.set_case_reference(case_ref)
-                            st.rerun()
+                        # Callbacks run before the rerun, so no extra st.rerun()
+                        st.button(
+                            f"📁 `{case_ref}`",
+                            key=f"case_{case_ref}",
+                            on_click=chat.set_case_reference,
+                            args=(case_ref,)
+                        )
                 with col2:
                     st.caption(f"{doc_count} docs")
         
@@ -779,41 +1449,34 @@ def render_sidebar(chat: WebChatInterface):
         uploaded_files = st.file_uploader(
             "Choose files",
             accept_multiple_files=True,
-            type=['pdf', 'jpg', 'jpeg', 'png', 'tiff', 'bmp'],
+            type=list(_upload_types()),
             label_visibility="collapsed"
         )
         
         if uploaded_files:
             st.info(f"📎 {len(uploaded_files)} file(s) selected")
             
-            if st.button("🚀 Process Documents", use_container_width=True, type="primary"):
-                with st.spinner("Processing documents..."):
-                    results = chat.process_uploaded_files(uploaded_files)
-                
-                if results.get("success"):
-                    case_ref = results.get('case_reference', 'Unlinked')
-                    link_msg = f"Linked to: `{case_ref}`" if st.session_state.case_reference else "📌 *Not linked to a case yet*"
-                    st.success(f"""
-✅ **Processing Complete!**
-- Files: {results.get('files_processed', 0)}
-- Documents: {results.get('documents_created', 0)}
-- {link_msg}
-                    """)
-                    
-                    # Add to chat
-                    file_names = [f.name for f in uploaded_files]
-                    msg = f"Processed {len(file_names)} file(s): {', '.join(file_names)}"
-                    chat_msg = f"✅ {msg}"
-                    if st.session_state.case_reference:
-                        chat_msg += f"\n\nDocuments linked to case `{case_ref}`"
-                    else:
-                        chat_msg += "\n\n📌 Documents processed but not linked to a case. Set a case to link them."
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": chat_msg
-                    })
+            # Rejected files are skipped rather than failing the whole batch
+            accepted_files = []
+            for f in uploaded_files:
+                reason = _upload_rejection(f)
+                if reason:
+                    st.warning(f"⚠️ {f.name} will be skipped: {reason}")
                 else:
-                    st.error(f"❌ Error: {results.get('error', 'Unknown error')}")
+                    accepted_files.append(f)
+            
+            if accepted_files:
+                # Disabled while a job runs so the same files are not queued twice
+                st.button(
+                    "🚀 Process Documents",
+                    use_container_width=True,
+                    type="primary",
+                    disabled=bool(st.session_state.pending_jobs),
+                    on_click=start_upload_job,
+                    args=(chat, accepted_files)
+                )
+        
+        render_upload_status()
         
         st.markdown("---")
         
@@ -822,22 +1485,125 @@ def render_sidebar(chat: WebChatInterface):
         
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Cases", len(chat.get_cases()))
+            st.metric("Cases", len(all_cases))
         with col2:
-            st.metric("Messages", len(st.session_state.messages))
+            st.metric("Messages", st.session_state.message_count)
         
         # Actions
         st.markdown("---")
         
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("🗑️ Clear Chat", use_container_width=True):
-                st.session_state.messages = []
-                st.session_state.conversation_history = []
-                st.rerun()
+            st.button("🗑️ Clear Chat", use_container_width=True, on_click=clear_chat)
         with col2:
-            if st.button("🔄 Refresh", use_container_width=True):
-                st.rerun()
+            # Clicking any button reruns the app
+            st.button("🔄 Refresh", use_container_width=True)
+        
+        if st.session_state.messages:
+            # Read from the chat log only when clicked, on Streamlit's download thread
+            session_id = st.session_state.chat_session_id
+            st.download_button(
+                "💾 Download Chat",
+                data=lambda: _get_chat_log().dump(session_id),
+                file_name=f"chat_{st.session_state.case_reference or 'session'}.json",
+                mime="application/json",
+                on_click="ignore",
+                use_container_width=True
+            )
+
+
+def clear_chat():
+    """Reset the chat history (button callback)."""
+    _get_chat_log().clear(st.session_state.chat_session_id)
+    st.session_state.messages = []
+    st.session_state.message_count = 0
+    st.session_state.conversation_history = deque()
+    st.session_state.history_summary = ""
+    st.session_state.msg_window = _MESSAGE_WINDOW
+
+
+def start_upload_job(chat: WebChatInterface, uploaded_files: List):
+    """Queue uploaded files for background processing (button callback)."""
+    # A click already in flight when the button was disabled is ignored
+    if st.session_state.pending_jobs:
+        return
+    
+    # Run in the background so the UI stays responsive
+    st.session_state.upload_notice = None
+    st.session_state.pending_jobs.append({
+        "future": chat.submit_uploaded_files(uploaded_files),
+        "file_names": [f.name for f in uploaded_files]
+    })
+
+
+def render_upload_status():
+    """Render background upload progress and the last finished upload's result."""
+    notice = st.session_state.upload_notice
+    if notice:
+        if notice["success"]:
+            st.success(notice["text"])
+        else:
+            st.error(notice["text"])
+    
+    if st.session_state.pending_jobs:
+        _poll_upload_jobs()
+
+
+@st.fragment(run_every=1)
+def _poll_upload_jobs():
+    """Poll background upload jobs, rerunning the app once any finish."""
+    jobs = st.session_state.pending_jobs
+    finished = [job for job in jobs if job["future"].done()]
+    
+    if not finished:
+        for job in jobs:
+            st.info(f"⏳ Processing {len(job['file_names'])} file(s)...")
+        return
+    
+    finished_ids = {id(job) for job in finished}
+    st.session_state.pending_jobs = [job for job in jobs if id(job) not in finished_ids]
+    for job in finished:
+        _complete_upload_job(job)
+    
+    # Full rerun so the chat and sidebar show the results
+    st.rerun()
+
+
+def _complete_upload_job(job: Dict[str, Any]):
+    """Record a finished upload job's result in the sidebar notice and chat."""
+    results = job["future"].result()
+    
+    # The pipeline rewrote document and case metadata in place
+    _invalidate_scans()
+    
+    if not results.get("success"):
+        st.session_state.upload_notice = {
+            "success": False,
+            "text": f"❌ Error: {results.get('error', 'Unknown error')}"
+        }
+        return
+    
+    case_ref = results.get('case_reference')
+    link_msg = f"Linked to: `{case_ref}`" if case_ref else "📌 *Not linked to a case yet*"
+    st.session_state.upload_notice = {
+        "success": True,
+        "text": f"""
+✅ **Processing Complete!**
+- Files: {results.get('files_processed', 0)}
+- Documents: {results.get('documents_created', 0)}
+- {link_msg}
+        """
+    }
+    
+    # Add to chat
+    file_names = job["file_names"]
+    msg = f"Processed {len(file_names)} file(s): {', '.join(file_names)}"
+    chat_msg = f"✅ {msg}"
+    if case_ref:
+        chat_msg += f"\n\nDocuments linked to case `{case_ref}`"
+    else:
+        chat_msg += "\n\n📌 Documents processed but not linked to a case. Set a case to link them."
+    _append_message("assistant", chat_msg)
 
 
 def render_case_viewer(chat: WebChatInterface):
@@ -901,18 +1667,44 @@ def render_case_viewer(chat: WebChatInterface):
                 st.caption(f"... and {len(documents) - 10} more")
 
 
+def _append_message(role: str, content: str) -> None:
+    """Record a chat message in the chat log and the in-memory window."""
+    chat_log = _get_chat_log()
+    chat_log.append(st.session_state.chat_session_id, role, content)
+    st.session_state.message_count = min(st.session_state.message_count + 1, chat_log.max_messages)
+    
+    messages = st.session_state.messages
+    messages.append({"role": role, "content": content})
+    del messages[:-st.session_state.msg_window]
+
+
+def show_earlier_messages():
+    """Widen the message window, reloading it from the chat log (button callback)."""
+    st.session_state.msg_window += _MESSAGE_WINDOW
+    st.session_state.messages = _get_chat_log().tail(
+        st.session_state.chat_session_id, st.session_state.msg_window
+    )
+
+
 def render_chat_messages():
-    """Render chat message history."""
-    for message in st.session_state.messages:
-        role = message["role"]
-        content = message["content"]
-        
-        if role == "user":
-            with st.chat_message("user"):
-                st.markdown(content)
-        else:
-            with st.chat_message("assistant"):
-                st.markdown(content)
+    """Render the most recent chat messages, with a button to load earlier ones."""
+    messages = st.session_state.messages
+    window = st.session_state.msg_window
+    
+    # Only the window is held in session state; the rest is in the chat log
+    hidden = st.session_state.message_count - len(messages)
+    if hidden > 0:
+        st.button(
+            f"⬆️ Load {min(_MESSAGE_WINDOW, hidden)} earlier messages",
+            on_click=show_earlier_messages
+        )
+    
+    # Streamlit drops any element a rerun doesn't emit, so every visible message
+    # is re-emitted; unchanged ones are matched by position and not re-drawn
+    for message in messages[-window:]:
+        role = "user" if message["role"] == "user" else "assistant"
+        with st.chat_message(role):
+            st.markdown(message["content"])
 
 
 def process_pending_message(chat: WebChatInterface):
@@ -927,46 +1719,61 @@ def process_pending_message(chat: WebChatInterface):
     # Clear the pending message
     st.session_state.pending_user_message = None
     
-    # Generate response
+    # Stream response
     with st.chat_message("assistant"):
-        with st.spinner("Thinking..."):
-            response = chat.get_response(pending)
-        st.markdown(response)
+        response = st.write_stream(_buffer_stream(chat.stream_response(pending)))
     
     # Add to messages
-    st.session_state.messages.append({
-        "role": "assistant",
-        "content": response
-    })
+    _append_message("assistant", response)
+
+
+def _is_duplicate_submission(text: str) -> bool:
+    """Return True for a repeat of the last submission (double-click/double-Enter).
+    
+    Records the submission otherwise, so each accepted message adds exactly one
+    user turn to the history sent with every later LLM prompt.
+    """
+    now = time.monotonic()
+    last = st.session_state.get('last_submission')
+    if last and last[0] == hash(text) and now - last[1] < _DUPLICATE_SUBMIT_WINDOW:
+        return True
+    st.session_state.last_submission = (hash(text), now)
+    return False
 
 
 def handle_quick_action(chat: WebChatInterface, action: str):
     """Handle quick action button clicks - generate response directly."""
+    if _is_duplicate_submission(action):
+        return
+    
     # Add user message to history
-    st.session_state.messages.append({
-        "role": "user", 
-        "content": action
-    })
+    _append_message("user", action)
     
     # For quick commands like "list cases", use the quick handler directly
     quick_response = chat._handle_quick_command(action)
     
     if quick_response:
         # Add quick response directly
-        st.session_state.messages.append({
-            "role": "assistant",
-            "content": quick_response
-        })
+        _append_message("assistant", quick_response)
     else:
         # Set pending for LLM response on next run
         st.session_state.pending_user_message = action
 
 
+def request_new_case():
+    """Ask the assistant to start case creation (button callback)."""
+    if _is_duplicate_submission("Create a new case"):
+        return
+    
+    # Prompt user to enter case ID
+    st.session_state.pending_user_message = "I want to create a new case. Please ask me for the case ID."
+    _append_message("user", "Create a new case")
+
+
 def render_main_content(chat: WebChatInterface):
     """Render main chat interface."""
     # Header from config
-    from utilities import get_banner_text
-    banner = get_banner_text('web')
+    banner = _banner('web')
     st.markdown(
         f'<div class="main-header">{banner["title"]}</div>',
         unsafe_allow_html=True
@@ -976,34 +1783,37 @@ def render_main_content(chat: WebChatInterface):
     # Case viewer
     render_case_viewer(chat)
     
-    # Process any pending message first
-    process_pending_message(chat)
+    # Chat runs in a fragment so sending a message skips the sidebar
+    _chat_fragment(chat)
+
+
+@st.fragment
+def _chat_fragment(chat: WebChatInterface):
+    """Render the chat history, input and suggestions as an isolated fragment."""
+    case_before = st.session_state.case_reference
     
     # Chat messages
     render_chat_messages()
     
+    # Stream the reply to any pending message below the history it belongs to,
+    # so it is drawn once instead of again by a follow-up history render
+    process_pending_message(chat)
+    
     # Chat input
-    if prompt := st.chat_input("Ask me anything about KYC-AML document processing..."):
+    prompt = st.chat_input("Ask me anything about KYC-AML document processing...")
+    if prompt and not _is_duplicate_submission(prompt):
         # Add user message
-        st.session_state.messages.append({
-            "role": "user",
-            "content": prompt
-        })
+        _append_message("user", prompt)
         
         with st.chat_message("user"):
             st.markdown(prompt)
         
-        # Get assistant response
+        # Stream assistant response
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = chat.get_response(prompt)
-            st.markdown(response)
+            response = st.write_stream(_buffer_stream(chat.stream_response(prompt)))
         
         # Add assistant response
-        st.session_state.messages.append({
-            "role": "assistant",
-            "content": response
-        })
+        _append_message("assistant", response)
     
     # Welcome suggestions (only if no messages)
     if not st.session_state.messages:
@@ -1012,25 +1822,29 @@ def render_main_content(chat: WebChatInterface):
         
         col1, col2, col3 = st.columns(3)
         
+        # Callbacks update state before the fragment reruns, so no st.rerun()
         with col1:
-            if st.button("📋 List all cases", use_container_width=True):
-                handle_quick_action(chat, "list cases")
-                st.rerun()
+            st.button(
+                "📋 List all cases",
+                use_container_width=True,
+                on_click=handle_quick_action,
+                args=(chat, "list cases")
+            )
         
         with col2:
-            if st.button("📁 Create a new case", use_container_width=True):
-                # Prompt user to enter case ID
-                st.session_state.pending_user_message = "I want to create a new case. Please ask me for the case ID."
-                st.session_state.messages.append({
-                    "role": "user",
-                    "content": "Create a new case"
-                })
-                st.rerun()
+            st.button("📁 Create a new case", use_container_width=True, on_click=request_new_case)
         
         with col3:
-            if st.button("❓ What can you do?", use_container_width=True):
-                handle_quick_action(chat, "help")
-                st.rerun()
+            st.button(
+                "❓ What can you do?",
+                use_container_width=True,
+                on_click=handle_quick_action,
+                args=(chat, "help")
+            )
+    
+    # Case switches from chat commands also change the sidebar and case viewer
+    if st.session_state.case_reference != case_before:
+        st.rerun()
 
 
 def main():
@@ -1042,16 +1856,12 @@ def main():
     if not st.session_state.initialized:
         chat.initialize_system()
     
-    # Sync case reference from session state
-    chat.case_reference = st.session_state.case_reference
-    
     # Render UI
     render_sidebar(chat)
     render_main_content(chat)
     
     # Footer from config
-    from utilities import get_banner_text
-    banner = get_banner_text('web')
+    banner = _banner('web')
     st.markdown("---")
     st.markdown(
         f"<div style='text-align: center; color: #666;'>"